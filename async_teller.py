@@ -0,0 +1,101 @@
+import asyncio
+import typing
+
+from catalog import AsyncSupermarketCatalog
+from instrumentation import CheckoutInstrumentation
+from models.money import Cents, to_cents
+from models.offers import Bundle, CompiledOffer, Offer, SpecialOfferType
+from models.products import Product, ProductQuantity
+from receipt import Receipt, ReceiptLineMode
+from shopping_cart import ShoppingCart
+from teller import OfferTable, Teller
+
+
+class AsyncTeller:
+    def __init__(
+        self,
+        catalog: AsyncSupermarketCatalog,
+        max_concurrency: int = 16,
+        line_mode: ReceiptLineMode = ReceiptLineMode.ITEMIZED,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.catalog = catalog
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._teller = Teller(catalog, line_mode)
+
+    @property
+    def line_mode(self) -> ReceiptLineMode:
+        return self._teller.line_mode
+
+    @property
+    def offer_table(self) -> OfferTable:
+        return self._teller.offer_table
+
+    @property
+    def offers(self) -> typing.Mapping[Product, Offer]:
+        return self._teller.offers
+
+    @property
+    def compiled_offers(self) -> typing.Mapping[Product, CompiledOffer]:
+        return self._teller.compiled_offers
+
+    @property
+    def bundles(self) -> typing.Mapping[Product, tuple[Bundle, ...]]:
+        return self._teller.bundles
+
+    @property
+    def instrumentation(self) -> CheckoutInstrumentation | None:
+        return self._teller.instrumentation
+
+    def add_special_offer(
+        self, offer_type: SpecialOfferType, product: Product, argument: float | None
+    ) -> None:
+        self._teller.add_special_offer(offer_type, product, argument)
+
+    def add_bundle_offer(
+        self,
+        offer_type: SpecialOfferType,
+        product_quantities: list[ProductQuantity],
+        argument: float | None,
+    ) -> None:
+        self._teller.add_bundle_offer(offer_type, product_quantities, argument)
+
+    def enable_instrumentation(
+        self, instrumentation: CheckoutInstrumentation | None = None
+    ) -> CheckoutInstrumentation:
+        if instrumentation is None:
+            instrumentation = CheckoutInstrumentation()
+        self._teller.instrumentation = instrumentation
+        return instrumentation
+
+    def disable_instrumentation(self) -> None:
+        self._teller.instrumentation = None
+
+    async def unit_prices_cents(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, Cents]:
+        semaphore = self._semaphore
+
+        async def fetch(product: Product) -> Cents:
+            async with semaphore:
+                return to_cents(await self.catalog.unit_price(product))
+
+        products = list(products)
+        prices = await asyncio.gather(*map(fetch, products))
+        return dict(zip(products, prices))
+
+    async def checks_out_articles_from(self, the_cart: ShoppingCart) -> Receipt:
+        instrumentation = self._teller.instrumentation
+        if instrumentation is None:
+            prices = await self.unit_prices_cents(the_cart.scanned_products)
+            return self._teller.checks_out_with_prices(the_cart, prices)
+
+        trace = instrumentation.start()
+        prices = await self.unit_prices_cents(the_cart.scanned_products)
+        instrumentation.count_catalog_calls(len(prices))
+        trace.mark("prices")
+        receipt = self._teller.checks_out_with_prices(the_cart, prices, trace)
+        instrumentation.finish(trace, receipt, len(prices))
+        return receipt
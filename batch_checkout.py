@@ -0,0 +1,309 @@
+import typing
+
+import numpy as np
+
+from bundle_allocation import BundleAllocation
+from models.money import ROUNDING_EPSILON
+from models.offers import Discount, Offer, SpecialOfferType
+from models.products import Product
+from receipt import Receipt, ReceiptItem, ReceiptLineMode
+from shopping_cart import ShoppingCart
+
+if typing.TYPE_CHECKING:
+    from teller import Teller
+
+
+def round_half_up(values: np.ndarray) -> np.ndarray:
+    magnitudes = np.floor(np.abs(values) + 0.5 + ROUNDING_EPSILON)
+    return (np.sign(values) * magnitudes).astype(np.int64)
+
+
+def three_for_two_cents(
+    quantities: np.ndarray,
+    unit_prices: np.ndarray,
+    arguments: np.ndarray,
+    argument_cents: np.ndarray,
+) -> np.ndarray:
+    return -round_half_up(quantities // 3 * unit_prices)
+
+
+def two_for_amount_cents(
+    quantities: np.ndarray,
+    unit_prices: np.ndarray,
+    arguments: np.ndarray,
+    argument_cents: np.ndarray,
+) -> np.ndarray:
+    return -round_half_up(quantities // 2 * (2 * unit_prices - argument_cents))
+
+
+def five_for_amount_cents(
+    quantities: np.ndarray,
+    unit_prices: np.ndarray,
+    arguments: np.ndarray,
+    argument_cents: np.ndarray,
+) -> np.ndarray:
+    return -round_half_up(quantities // 5 * (5 * unit_prices - argument_cents))
+
+
+def ten_percent_cents(
+    quantities: np.ndarray,
+    unit_prices: np.ndarray,
+    arguments: np.ndarray,
+    argument_cents: np.ndarray,
+) -> np.ndarray:
+    return -round_half_up(quantities * unit_prices * arguments / 100)
+
+
+VECTOR_OFFERS: typing.Dict[
+    SpecialOfferType, tuple[float, typing.Callable[..., np.ndarray]]
+] = {
+    SpecialOfferType.THREE_FOR_TWO: (3, three_for_two_cents),
+    SpecialOfferType.TWO_FOR_AMOUNT: (2, two_for_amount_cents),
+    SpecialOfferType.FIVE_FOR_AMOUNT: (5, five_for_amount_cents),
+    SpecialOfferType.TEN_PERCENT_DISCOUNT: (-np.inf, ten_percent_cents),
+}
+
+
+class BatchTotals:
+    def __init__(self, gross_cents: np.ndarray, discount_cents: np.ndarray) -> None:
+        self.gross_cents = gross_cents
+        self.discount_cents = discount_cents
+
+    def __len__(self) -> int:
+        return len(self.gross_cents)
+
+    @property
+    def total_cents(self) -> np.ndarray:
+        return self.gross_cents + self.discount_cents
+
+
+class _Batch:
+    def __init__(self, teller: "Teller", carts: typing.Iterable[ShoppingCart]) -> None:
+        self.carts = carts = list(carts)
+        table = teller.offer_table
+        bundles = table.bundles
+
+        product_indexes: typing.Dict[Product, int] = {}
+        line_products = []
+        line_indexes = []
+        line_quantities = []
+        line_starts = []
+        aggregated = teller.line_mode == ReceiptLineMode.AGGREGATED
+        for cart in carts:
+            line_starts.append(len(line_products))
+            if aggregated:
+                line_products.extend(cart.product_quantities)
+                line_quantities.extend(cart.product_quantities.values())
+            else:
+                for pq in cart.items:
+                    line_products.append(pq.product)
+                    line_quantities.append(pq.quantity)
+        line_starts.append(len(line_products))
+        for product in line_products:
+            index = product_indexes.get(product)
+            if index is None:
+                index = product_indexes[product] = len(product_indexes)
+            line_indexes.append(index)
+
+        self.products = products = list(product_indexes)
+        self.prices = prices = teller.catalog.unit_prices_cents(products)
+        self.line_products = line_products
+        self.line_quantities = line_quantities
+        self.line_starts = line_starts
+
+        cart_count = len(carts)
+        line_cart = np.repeat(
+            np.arange(cart_count, dtype=np.intp), np.diff(np.array(line_starts))
+        )
+        line_index = np.array(line_indexes, dtype=np.intp)
+        quantities = np.array(line_quantities, dtype=np.float64)
+        price_table = np.array([prices[product] for product in products], np.int64)
+        self.line_prices = price_table[line_index]
+        self.line_totals = round_half_up(quantities * self.line_prices)
+        self.gross_cents = np.bincount(
+            line_cart, weights=self.line_totals, minlength=cart_count
+        ).astype(np.int64)
+
+        bundled = np.array([product in bundles for product in products], dtype=bool)
+        scalar_carts = (
+            np.bincount(line_cart, weights=bundled[line_index], minlength=cart_count)
+            + np.bincount(line_cart, weights=quantities < 0, minlength=cart_count)
+        ) > 0
+        self.allocations: typing.Dict[int, BundleAllocation] = {}
+        self.discount_cents = np.zeros(cart_count, dtype=np.int64)
+
+        vector_lines = np.flatnonzero(~scalar_carts[line_cart])
+        keys = line_cart[vector_lines] * len(products) + line_index[vector_lines]
+        keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        row_carts = [keys // max(len(products), 1)]
+        row_products = [keys % max(len(products), 1)]
+        row_quantities = [
+            np.bincount(inverse, weights=quantities[vector_lines], minlength=len(keys))
+        ]
+        row_orders = [vector_lines[first]]
+
+        for cart_index in np.flatnonzero(scalar_carts).tolist():
+            cart = carts[cart_index]
+            allocation = cart.allocate_bundles(bundles, table.compiled_offers, prices)
+            if allocation.applications:
+                self.allocations[cart_index] = allocation
+                for bundle, applications in allocation.applications.items():
+                    self.discount_cents[cart_index] -= bundle.saving_cents(
+                        applications, prices
+                    )
+            remaining = allocation.remaining
+            cart_quantities = cart.product_quantities
+            row_carts.append(np.full(len(cart_quantities), cart_index, np.intp))
+            row_products.append(
+                np.array([product_indexes[p] for p in cart_quantities], np.intp)
+            )
+            row_quantities.append(
+                np.array(
+                    [remaining.get(p, q) for p, q in cart_quantities.items()],
+                    np.float64,
+                )
+            )
+            row_orders.append(
+                np.arange(len(cart_quantities), dtype=np.intp) + line_starts[cart_index]
+            )
+
+        offers = table.offers
+        self.offers: list[Offer | None] = [offers.get(p) for p in products]
+        offer_types = list(VECTOR_OFFERS)
+        type_codes = np.array(
+            [
+                -2 if offer is None else _type_code(offer_types, offer.offer_type)
+                for offer in self.offers
+            ],
+            dtype=np.intp,
+        )
+        row_cart = np.concatenate(row_carts)
+        row_product = np.concatenate(row_products)
+        row_quantity = np.concatenate(row_quantities)
+        order = np.argsort(np.concatenate(row_orders), kind="stable")
+        row_cart, row_product, row_quantity = (
+            row_cart[order],
+            row_product[order],
+            row_quantity[order],
+        )
+        selected = np.flatnonzero((type_codes[row_product] != -2) & (row_quantity > 0))
+        self.row_cart = row_cart = row_cart[selected]
+        self.row_product = row_product = row_product[selected]
+        self.row_quantity = row_quantity = row_quantity[selected]
+        self.row_starts = np.searchsorted(row_cart, np.arange(cart_count + 1))
+
+        self.amounts = np.zeros(len(row_product), dtype=np.int64)
+        self.valid = np.zeros(len(row_product), dtype=bool)
+        row_types = type_codes[row_product]
+        arguments = np.array(
+            [
+                0.0 if offer is None or offer.argument is None else offer.argument
+                for offer in self.offers
+            ],
+            dtype=np.float64,
+        )
+        argument_cents = np.array(
+            [
+                0 if offer is None else offer.argument_cents or 0
+                for offer in self.offers
+            ],
+            dtype=np.int64,
+        )
+        for code, offer_type in enumerate(offer_types):
+            minimum_quantity, amounts_of = VECTOR_OFFERS[offer_type]
+            rows = np.flatnonzero(
+                (row_types == code) & (row_quantity >= minimum_quantity)
+            )
+            if not len(rows):
+                continue
+            row_offer_products = row_product[rows]
+            self.amounts[rows] = amounts_of(
+                row_quantity[rows],
+                price_table[row_offer_products],
+                arguments[row_offer_products],
+                argument_cents[row_offer_products],
+            )
+            self.valid[rows] = True
+
+        self.scalar_discounts: typing.Dict[int, Discount] = {}
+        compiled_offers = table.compiled_offers
+        for row in np.flatnonzero(row_types == -1).tolist():
+            product = products[row_product[row]]
+            discount = compiled_offers[product](row_quantity[row].item(), prices)
+            if discount is not None:
+                self.scalar_discounts[row] = discount
+                self.discount_cents[row_cart[row]] += discount.discount_cents
+
+        self.discount_cents += np.bincount(
+            row_cart[self.valid],
+            weights=self.amounts[self.valid],
+            minlength=cart_count,
+        ).astype(np.int64)
+
+    def receipts(self) -> list[Receipt]:
+        products = self.products
+        offers = self.offers
+        prices = self.prices
+        receipt_items = list(
+            map(
+                ReceiptItem,
+                self.line_products,
+                self.line_quantities,
+                self.line_prices.tolist(),
+                self.line_totals.tolist(),
+            )
+        )
+        scalar_discounts = self.scalar_discounts
+        kept = self.valid.copy()
+        kept[list(scalar_discounts)] = True
+        kept_rows = np.flatnonzero(kept)
+        discounts = [
+            scalar_discounts[row]
+            if row in scalar_discounts
+            else Discount.from_cents(
+                products[product], offers[product].description, amount
+            )
+            for row, product, amount in zip(
+                kept_rows.tolist(),
+                self.row_product[kept_rows].tolist(),
+                self.amounts[kept_rows].tolist(),
+            )
+        ]
+        discount_starts = np.searchsorted(
+            self.row_cart[kept_rows], np.arange(len(self.carts) + 1)
+        ).tolist()
+        line_starts = self.line_starts
+        allocations = self.allocations
+
+        receipts = []
+        for cart_index, cart in enumerate(self.carts):
+            receipt = Receipt()
+            start = line_starts[cart_index]
+            end = line_starts[cart_index + 1]
+            receipt.add_items(receipt_items[start:end])
+            if cart_index in allocations:
+                cart.handle_bundles(receipt, allocations[cart_index], prices)
+            start = discount_starts[cart_index]
+            end = discount_starts[cart_index + 1]
+            receipt.add_discounts(discounts[start:end])
+            receipts.append(receipt)
+        return receipts
+
+
+def checks_out_many(
+    teller: "Teller", carts: typing.Iterable[ShoppingCart]
+) -> list[Receipt]:
+    return _Batch(teller, carts).receipts()
+
+
+def checks_out_totals(
+    teller: "Teller", carts: typing.Iterable[ShoppingCart]
+) -> BatchTotals:
+    batch = _Batch(teller, carts)
+    return BatchTotals(batch.gross_cents, batch.discount_cents)
+
+
+def _type_code(
+    offer_types: list[SpecialOfferType], offer_type: SpecialOfferType
+) -> int:
+    return offer_types.index(offer_type) if offer_type in VECTOR_OFFERS else -1
@@ -0,0 +1,68 @@
+import gc
+import random
+import time
+import typing
+
+from catalog import InMemoryCatalog
+from models.offers import SpecialOfferType
+from models.products import Product, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+CARTS = 20_000
+PRODUCTS = 500
+OFFER_TYPES = (
+    (SpecialOfferType.THREE_FOR_TWO, None),
+    (SpecialOfferType.TEN_PERCENT_DISCOUNT, 10),
+    (SpecialOfferType.TWO_FOR_AMOUNT, 1.99),
+    (SpecialOfferType.FIVE_FOR_AMOUNT, 4.99),
+)
+
+
+def build() -> tuple[Teller, list[ShoppingCart]]:
+    generator = random.Random(1)
+    catalog = InMemoryCatalog()
+    teller = Teller(catalog)
+    products = [Product(f"product-{i}", ProductUnit.EACH) for i in range(PRODUCTS)]
+    for index, product in enumerate(products):
+        catalog.add_product(product, round(generator.uniform(0.2, 9.99), 2))
+        if index % 3 == 0:
+            offer_type, argument = OFFER_TYPES[index % len(OFFER_TYPES)]
+            teller.add_special_offer(offer_type, product, argument)
+
+    carts = []
+    for _ in range(CARTS):
+        cart = ShoppingCart()
+        for _ in range(generator.randint(1, 30)):
+            cart.add_item_quantity(generator.choice(products), generator.randint(1, 6))
+        carts.append(cart)
+    return teller, carts
+
+
+def best_of(runs: int, function: typing.Callable[[], object]) -> float:
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    teller, carts = build()
+
+    scalar = best_of(
+        3, lambda: [teller.checks_out_articles_from(cart) for cart in carts]
+    )
+    batch = best_of(3, lambda: teller.checks_out_many(carts))
+    totals = best_of(3, lambda: teller.checks_out_totals(carts))
+
+    print(f"{'path':<8} {'seconds':>8} {'carts/s':>10}")
+    print(f"{'scalar':<8} {scalar:>8.3f} {CARTS / scalar:>10.0f}")
+    print(f"{'batch':<8} {batch:>8.3f} {CARTS / batch:>10.0f}")
+    print(f"{'totals':<8} {totals:>8.3f} {CARTS / totals:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import timeit
+
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt import Receipt
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+SIZES = (10, 100, 1_000, 10_000)
+
+
+def build(size: int) -> tuple[ShoppingCart, Teller]:
+    catalog = FakeCatalog()
+    teller = Teller(catalog)
+    cart = ShoppingCart()
+    products = [Product(f"product-{i}", ProductUnit.EACH) for i in range(size)]
+    for product in products:
+        catalog.add_product(product, 1.0)
+        cart.add_item_quantity(product, 2)
+    for first, second in zip(products[::2], products[1::2]):
+        teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(first, 1), ProductQuantity(second, 1)],
+            10,
+        )
+    return cart, teller
+
+
+def main() -> None:
+    print(f"{'lines':>8} {'handle_bundles (ms)':>20} {'per line (us)':>14}")
+    for size in SIZES:
+        cart, teller = build(size)
+        prices = teller.catalog.unit_prices_cents(cart.product_quantities.keys())
+        table = teller.offer_table
+        number = max(1, 10_000 // size)
+        elapsed = min(
+            timeit.repeat(
+                lambda: cart.handle_bundles(
+                    Receipt(),
+                    cart.allocate_bundles(table.bundles, table.compiled_offers, prices),
+                    prices,
+                ),
+                number=number,
+                repeat=5,
+            )
+        )
+        per_run = elapsed / number
+        print(f"{size:>8} {per_run * 1e3:>20.3f} {per_run / size * 1e6:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
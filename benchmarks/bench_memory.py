@@ -0,0 +1,61 @@
+import tracemalloc
+
+from models.offers import Discount
+from models.products import Product, ProductUnit
+from receipt import ReceiptItem
+
+LINES = 100_000
+
+
+class DictProduct:
+    def __init__(self, name, unit):
+        self.name = name
+        self.unit = unit
+
+
+class DictReceiptItem:
+    def __init__(self, product, quantity, price, total_price):
+        self.product = product
+        self.quantity = quantity
+        self.price = price
+        self.total_price = total_price
+
+
+class DictDiscount:
+    def __init__(self, product, description, discount_amount):
+        self.product = product
+        self.description = description
+        self.discount_amount = discount_amount
+
+
+def bytes_per_line(product_type, item_type, discount_type, price, total) -> float:
+    description = "10% off"
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    lines = []
+    for i in range(LINES):
+        product = product_type("product", ProductUnit.EACH)
+        quantity = float(i)
+        lines.append(item_type(product, quantity, price, total(quantity)))
+        lines.append(discount_type(product, description, -quantity * 0.15))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lines
+    return (after - before) / LINES
+
+
+def main() -> None:
+    dict_backed = bytes_per_line(
+        DictProduct, DictReceiptItem, DictDiscount, 1.5, lambda quantity: quantity * 1.5
+    )
+    slotted = bytes_per_line(
+        Product, ReceiptItem, Discount, 150, lambda quantity: int(quantity) * 150
+    )
+    print(f"{'representation':<16} {'bytes per line':>15}")
+    print(f"{'dict-backed':<16} {dict_backed:>15.1f}")
+    print(f"{'slotted':<16} {slotted:>15.1f}")
+    print(f"{'saving':<16} {1 - slotted / dict_backed:>14.1%}")
+
+
+if __name__ == "__main__":
+    main()
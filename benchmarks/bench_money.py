@@ -0,0 +1,120 @@
+import random
+import timeit
+
+from catalog import InMemoryCatalog
+from models.money import round_half_up, to_cents
+from models.offers import SpecialOfferType
+from models.products import Product, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+BASKETS = 2_000
+LINES = 25
+
+
+def build() -> list[list[tuple[float, float, int]]]:
+    generator = random.Random(3)
+    return [
+        [
+            (
+                generator.randint(1, 6)
+                if generator.random() < 0.8
+                else round(generator.uniform(0.1, 3.0), 3),
+                round(generator.uniform(0.2, 9.99), 2),
+                generator.randint(1, 4),
+            )
+            for _ in range(LINES)
+        ]
+        for _ in range(BASKETS)
+    ]
+
+
+def float_totals(baskets: list[list[tuple[float, float, int]]]) -> list[float]:
+    totals = []
+    for basket in baskets:
+        total = 0.0
+        for quantity, unit_price, offer in basket:
+            total += quantity * unit_price
+            if offer == 1 and quantity >= 3:
+                quotient = quantity // 3
+                total -= quantity * unit_price - (
+                    (quotient * 2 * unit_price) + quantity % 3 * unit_price
+                )
+            elif offer == 2:
+                total -= quantity * unit_price * 10 / 100.0
+        totals.append(total)
+    return totals
+
+
+def cents_totals(baskets: list[list[tuple[float, int, int]]]) -> list[int]:
+    totals = []
+    for basket in baskets:
+        total = 0
+        for quantity, unit_price, offer in basket:
+            line_total = quantity * unit_price
+            if line_total.__class__ is not int:
+                line_total = round_half_up(line_total)
+            total += line_total
+            if offer == 1 and quantity >= 3:
+                free_total = quantity // 3 * unit_price
+                if free_total.__class__ is not int:
+                    free_total = round_half_up(free_total)
+                total -= free_total
+            elif offer == 2:
+                total -= round_half_up(quantity * unit_price * 10 / 100)
+        totals.append(total)
+    return totals
+
+
+def checkout(
+    baskets: list[list[tuple[float, float, int]]]
+) -> tuple[Teller, list[ShoppingCart]]:
+    catalog = InMemoryCatalog()
+    teller = Teller(catalog)
+    carts = []
+    for basket_index, basket in enumerate(baskets):
+        cart = ShoppingCart()
+        for line, (quantity, unit_price, offer) in enumerate(basket):
+            unit = ProductUnit.EACH if quantity.__class__ is int else ProductUnit.KILO
+            product = Product(f"product-{basket_index}-{line}", unit)
+            catalog.add_product(product, unit_price)
+            if offer == 1:
+                teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, product, None)
+            elif offer == 2:
+                teller.add_special_offer(
+                    SpecialOfferType.TEN_PERCENT_DISCOUNT, product, 10
+                )
+            cart.add_item_quantity(product, quantity)
+        carts.append(cart)
+    return teller, carts
+
+
+def main() -> None:
+    baskets = build()
+    cents_baskets = [
+        [(quantity, to_cents(price), offer) for quantity, price, offer in basket]
+        for basket in baskets
+    ]
+    float_time = min(timeit.repeat(lambda: float_totals(baskets), number=5, repeat=5))
+    cents_time = min(
+        timeit.repeat(lambda: cents_totals(cents_baskets), number=5, repeat=5)
+    )
+    teller, carts = checkout(baskets)
+    checkout_time = min(
+        timeit.repeat(
+            lambda: [teller.checks_out_articles_from(cart) for cart in carts],
+            number=5,
+            repeat=5,
+        )
+    )
+    per_basket = 5 * BASKETS / 1e6
+    overhead = (cents_time - float_time) / checkout_time
+    print(f"{'path':<8} {'us per basket':>14}")
+    print(f"{'float':<8} {float_time / per_basket:>14.2f}")
+    print(f"{'cents':<8} {cents_time / per_basket:>14.2f}")
+    print(f"{'checkout':<8} {checkout_time / per_basket:>14.2f}")
+    print(f"cents overhead is {overhead:.1%} of a full checkout")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import random
+import threading
+import time
+
+from catalog import InMemoryCatalog
+from models.offers import SpecialOfferType
+from models.products import Product, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+PRODUCTS = 500
+CARTS = 200
+TILLS = (1, 4, 8)
+SECONDS = 2.0
+
+
+def build() -> tuple[Teller, list[Product], list[ShoppingCart]]:
+    generator = random.Random(1)
+    catalog = InMemoryCatalog()
+    teller = Teller(catalog)
+    products = [Product(f"product-{i}", ProductUnit.EACH) for i in range(PRODUCTS)]
+    for index, product in enumerate(products):
+        catalog.add_product(product, round(generator.uniform(0.2, 9.99), 2))
+        if index % 3 == 0:
+            teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, product, 10)
+
+    carts = []
+    for _ in range(CARTS):
+        cart = ShoppingCart()
+        for _ in range(generator.randint(1, 30)):
+            cart.add_item_quantity(generator.choice(products), generator.randint(1, 6))
+        carts.append(cart)
+    return teller, products, carts
+
+
+def run(
+    teller: Teller,
+    products: list[Product],
+    carts: list[ShoppingCart],
+    tills: int,
+    updating: bool,
+) -> tuple[int, int]:
+    stop = threading.Event()
+    checkouts = [0] * tills
+    updates = [0]
+
+    def till(index: int) -> None:
+        while not stop.is_set():
+            for cart in carts:
+                teller.checks_out_articles_from(cart)
+            checkouts[index] += len(carts)
+
+    def promotions() -> None:
+        generator = random.Random(2)
+        while not stop.is_set():
+            teller.add_special_offer(
+                SpecialOfferType.TEN_PERCENT_DISCOUNT,
+                generator.choice(products),
+                generator.randint(5, 30),
+            )
+            updates[0] += 1
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=till, args=(index,)) for index in range(tills)]
+    if updating:
+        threads.append(threading.Thread(target=promotions))
+    for thread in threads:
+        thread.start()
+    time.sleep(SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(checkouts), updates[0]
+
+
+def main() -> None:
+    teller, products, carts = build()
+
+    print(f"{'tills':>5} {'quiet carts/s':>14} {'updating carts/s':>17} {'updates':>8}")
+    for tills in TILLS:
+        quiet, _ = run(teller, products, carts, tills, updating=False)
+        busy, updates = run(teller, products, carts, tills, updating=True)
+        print(
+            f"{tills:>5} {quiet / SECONDS:>14.0f} {busy / SECONDS:>17.0f} "
+            f"{updates:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import random
+import time
+
+from catalog import InMemoryCatalog
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from promotion_simulator import PromotionSimulator
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+BASKETS = 50_000
+PRODUCTS = 1_000
+SCENARIOS = 12
+
+
+def build() -> tuple[InMemoryCatalog, list[Product], list[ShoppingCart]]:
+    generator = random.Random(1)
+    catalog = InMemoryCatalog()
+    products = [Product(f"product-{i}", ProductUnit.EACH) for i in range(PRODUCTS)]
+    for product in products:
+        catalog.add_product(product, round(generator.uniform(0.2, 9.99), 2))
+
+    carts = []
+    for _ in range(BASKETS):
+        cart = ShoppingCart()
+        for _ in range(generator.randint(1, 30)):
+            cart.add_item_quantity(generator.choice(products), generator.randint(1, 6))
+        carts.append(cart)
+    return catalog, products, carts
+
+
+def scenario(products: list[Product], seed: int):
+    generator = random.Random(seed)
+    promoted = generator.sample(products, 100)
+
+    def configure(teller: Teller) -> None:
+        for product in promoted[:80]:
+            teller.add_special_offer(
+                SpecialOfferType.TEN_PERCENT_DISCOUNT,
+                product,
+                generator.choice((5, 10, 20)),
+            )
+        for first, second in zip(promoted[80::2], promoted[81::2]):
+            teller.add_bundle_offer(
+                SpecialOfferType.TEN_PERCENT_DISCOUNT,
+                [ProductQuantity(first, 1), ProductQuantity(second, 1)],
+                15,
+            )
+
+    return configure
+
+
+def main() -> None:
+    catalog, products, carts = build()
+    scenarios = {f"scenario-{i}": scenario(products, i) for i in range(SCENARIOS)}
+
+    start = time.perf_counter()
+    simulator = PromotionSimulator(catalog, carts)
+    prepared = time.perf_counter() - start
+    start = time.perf_counter()
+    simulator.simulate_many(scenarios)
+    simulated = time.perf_counter() - start
+
+    teller = Teller(catalog)
+    next(iter(scenarios.values()))(teller)
+    start = time.perf_counter()
+    for cart in carts:
+        teller.checks_out_articles_from(cart)
+    checkout = time.perf_counter() - start
+
+    print(f"baskets={BASKETS} scenarios={SCENARIOS}")
+    print(f"{'path':<24} {'seconds':>8}")
+    print(f"{'simulator setup':<24} {prepared:>8.3f}")
+    print(f"{'simulator per scenario':<24} {simulated / SCENARIOS:>8.3f}")
+    print(f"{'checkout per scenario':<24} {checkout:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import typing
+
+from catalog import InMemoryCatalog
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+PRODUCTS = 1_000
+LINES_PER_SAMPLE = 10_000
+SIZES = {"small": 5, "medium": 40, "large": 400}
+DENSITIES = {"none": 0.0, "sparse": 0.1, "dense": 0.5}
+OFFER_TYPES = (
+    (SpecialOfferType.THREE_FOR_TWO, None),
+    (SpecialOfferType.TEN_PERCENT_DISCOUNT, 10),
+    (SpecialOfferType.TWO_FOR_AMOUNT, 1.99),
+    (SpecialOfferType.FIVE_FOR_AMOUNT, 4.99),
+)
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+THRESHOLD = 0.25
+REFERENCE_ITEMS = 10_000
+
+Lines = list[tuple[Product, float]]
+Benchmark = typing.Callable[[], object]
+
+
+class Scenario:
+    def __init__(self, size: str, density: str, seed: int = 1) -> None:
+        generator = random.Random(seed)
+        catalog = InMemoryCatalog()
+        self.teller = Teller(catalog)
+        self.products = [
+            Product(f"product-{index}", ProductUnit.EACH) for index in range(PRODUCTS)
+        ]
+        for product in self.products:
+            catalog.add_product(product, round(generator.uniform(0.2, 9.99), 2))
+
+        promoted = generator.sample(self.products, int(PRODUCTS * DENSITIES[density]))
+        for index, product in enumerate(promoted):
+            offer_type, argument = OFFER_TYPES[index % len(OFFER_TYPES)]
+            self.teller.add_special_offer(offer_type, product, argument)
+        for first, second in zip(promoted[::4], promoted[1::4]):
+            self.teller.add_bundle_offer(
+                SpecialOfferType.TEN_PERCENT_DISCOUNT,
+                [ProductQuantity(first, 1), ProductQuantity(second, 1)],
+                10,
+            )
+
+        lines = SIZES[size]
+        self.baskets: list[Lines] = [
+            [
+                (generator.choice(self.products), generator.randint(1, 6))
+                for _ in range(lines)
+            ]
+            for _ in range(max(1, LINES_PER_SAMPLE // lines))
+        ]
+        self.carts = [self.scan(basket) for basket in self.baskets]
+        self.prices = [
+            catalog.unit_prices_cents(cart.scanned_products) for cart in self.carts
+        ]
+        self.receipts = [self.teller.checks_out_articles_from(c) for c in self.carts]
+
+    @staticmethod
+    def scan(basket: Lines) -> ShoppingCart:
+        cart = ShoppingCart()
+        for product, quantity in basket:
+            cart.add_item_quantity(product, quantity)
+        return cart
+
+
+def scan(scenario: Scenario) -> Benchmark:
+    baskets = scenario.baskets
+    return lambda: [Scenario.scan(basket) for basket in baskets]
+
+
+def checkout(scenario: Scenario) -> Benchmark:
+    teller = scenario.teller
+    carts = scenario.carts
+    return lambda: [teller.checks_out_articles_from(cart) for cart in carts]
+
+
+def bundles(scenario: Scenario) -> Benchmark:
+    table = scenario.teller.offer_table
+    carts = list(zip(scenario.carts, scenario.prices))
+    return lambda: [
+        cart.allocate_bundles(table.bundles, table.compiled_offers, prices)
+        for cart, prices in carts
+    ]
+
+
+def print_receipts(scenario: Scenario) -> Benchmark:
+    printer = ReceiptPrinter()
+    receipts = scenario.receipts
+    return lambda: [printer.print_receipt(receipt) for receipt in receipts]
+
+
+def print_batch(scenario: Scenario) -> Benchmark:
+    printer = ReceiptPrinter()
+    receipts = scenario.receipts
+    return lambda: list(printer.print_receipts(receipts))
+
+
+BENCHMARKS: typing.Dict[str, typing.Callable[[Scenario], Benchmark]] = {
+    "scan": scan,
+    "checkout": checkout,
+    "bundles": bundles,
+    "print": print_receipts,
+    "print_batch": print_batch,
+}
+
+
+def reference() -> Benchmark:
+    names = [f"product-{index % PRODUCTS}" for index in range(REFERENCE_ITEMS)]
+
+    def workload() -> list[int]:
+        totals: typing.Dict[str, int] = {}
+        for index, name in enumerate(names):
+            totals[name] = totals.get(name, 0) + index * 3 // 2
+        return sorted(totals.values())
+
+    return workload
+
+
+def run(
+    repeat: int = 7, selected: str = "", report: typing.TextIO | None = None
+) -> typing.Dict[str, float]:
+    calibration = reference()
+    results = {}
+    for size in SIZES:
+        for density in DENSITIES:
+            scenario = None
+            for name, benchmark in BENCHMARKS.items():
+                key = f"{name}/{size}/{density}"
+                if selected not in key:
+                    continue
+                if scenario is None:
+                    scenario = Scenario(size, density)
+                function = benchmark(scenario)
+                elapsed = []
+                reference_elapsed = []
+                for _ in range(repeat):
+                    elapsed.append(timeit.timeit(function, number=1))
+                    reference_elapsed.append(timeit.timeit(calibration, number=1))
+                results[key] = min(elapsed) / min(reference_elapsed)
+                if report is not None:
+                    microseconds = min(elapsed) / len(scenario.baskets) * 1e6
+                    print(
+                        f"{key:<28} {microseconds:>12.2f} {results[key]:>10.3f}",
+                        file=report,
+                    )
+    return results
+
+
+def compare(
+    results: typing.Dict[str, float],
+    baseline: typing.Dict[str, float],
+    threshold: float = THRESHOLD,
+) -> list[tuple[str, float, float]]:
+    return [
+        (key, baseline[key], ratio)
+        for key, ratio in results.items()
+        if key in baseline and ratio > baseline[key] * (1 + threshold)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the checkout pipeline against a stored baseline."
+    )
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="overwrite the baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':<28} {'us/basket':>12} {'x reference':>10}", file=sys.stderr)
+    ratios = run(args.repeat, args.filter, sys.stderr)
+
+    if args.save:
+        with open(args.baseline, "w") as file:
+            json.dump(ratios, file, indent=2, sort_keys=True)
+            file.write("\n")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save", file=sys.stderr)
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(ratios, baseline, args.threshold)
+    for key, before, after in regressions:
+        print(
+            f"REGRESSION {key}: {before:.3f} -> {after:.3f} x reference "
+            f"(+{(after / before - 1) * 100:.0f}%)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import math
+import typing
+
+from models.money import Cents
+from models.offers import Bundle, CompiledOffer
+from models.products import Product
+
+DEFAULT_STEP_LIMIT = 50_000
+MAX_SEARCH_DEPTH = 64
+
+
+class BundleAllocation:
+    def __init__(self) -> None:
+        self.applications: typing.Dict[Bundle, int] = {}
+        self.remaining: typing.Dict[Product, float] = {}
+
+
+def connected_bundles(
+    product: Product, bundles_by_product: typing.Dict[Product, typing.Sequence[Bundle]]
+) -> list[Bundle]:
+    bundles: typing.Dict[Bundle, None] = {}
+    pending = [product]
+    seen = {product}
+    while pending:
+        for bundle in bundles_by_product.get(pending.pop(), ()):
+            if bundle in bundles:
+                continue
+            bundles[bundle] = None
+            for bundle_pq in bundle.product_quantities:
+                if bundle_pq.product not in seen:
+                    seen.add(bundle_pq.product)
+                    pending.append(bundle_pq.product)
+    return list(bundles)
+
+
+def allocate_bundles(
+    bundles: typing.Iterable[Bundle],
+    product_quantities: typing.Dict[Product, float],
+    offers: typing.Dict[Product, CompiledOffer],
+    prices: typing.Dict[Product, Cents],
+    step_limit: int = DEFAULT_STEP_LIMIT,
+) -> BundleAllocation:
+    candidates = [
+        bundle
+        for bundle in dict.fromkeys(bundles)
+        if bundle.applications_in(product_quantities)
+    ]
+    allocation = BundleAllocation()
+    if not candidates:
+        return allocation
+
+    applications: typing.Dict[Bundle, int] = {}
+    for component in _components(sorted(candidates, key=_sequence)):
+        search = _ComponentSearch(
+            component, product_quantities, offers, prices, step_limit
+        )
+        applications.update(zip(component, search.solve()))
+        allocation.remaining.update(search.remaining)
+    for bundle in candidates:
+        if applications[bundle]:
+            allocation.applications[bundle] = applications[bundle]
+    return allocation
+
+
+def _sequence(bundle: Bundle) -> int:
+    return bundle.sequence
+
+
+def _components(bundles: list[Bundle]) -> list[list[Bundle]]:
+    parents = list(range(len(bundles)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owners: typing.Dict[Product, int] = {}
+    for index, bundle in enumerate(bundles):
+        for bundle_pq in bundle.product_quantities:
+            owner = find(owners.setdefault(bundle_pq.product, index))
+            root = find(index)
+            parents[max(owner, root)] = min(owner, root)
+
+    components: typing.Dict[int, list[Bundle]] = {}
+    for index, bundle in enumerate(bundles):
+        components.setdefault(find(index), []).append(bundle)
+    return list(components.values())
+
+
+class _ComponentSearch:
+    def __init__(
+        self,
+        bundles: list[Bundle],
+        product_quantities: typing.Dict[Product, float],
+        offers: typing.Dict[Product, CompiledOffer],
+        prices: typing.Dict[Product, Cents],
+        step_limit: int,
+    ) -> None:
+        self.bundles = bundles
+        self.offers = offers
+        self.prices = prices
+        self.step_limit = step_limit
+        self.remaining = {
+            bundle_pq.product: product_quantities[bundle_pq.product]
+            for bundle in bundles
+            for bundle_pq in bundle.product_quantities
+        }
+        self.offered = [product for product in self.remaining if product in offers]
+        self.steps = 0
+        self.applications = [0] * len(bundles)
+        self.best_saving: float = -math.inf
+        self.best_applications: list[int] = []
+
+    def solve(self) -> list[int]:
+        if len(self.bundles) > MAX_SEARCH_DEPTH:
+            self._greedy()
+        else:
+            self._search(0, 0)
+        for bundle, applications in zip(self.bundles, self.best_applications):
+            for bundle_pq in bundle.product_quantities:
+                self.remaining[bundle_pq.product] -= applications * bundle_pq.quantity
+        return self.best_applications
+
+    def _greedy(self) -> None:
+        remaining = dict(self.remaining)
+        for bundle in self.bundles:
+            applications = bundle.applications_in(remaining)
+            for bundle_pq in bundle.product_quantities:
+                remaining[bundle_pq.product] -= applications * bundle_pq.quantity
+            self.best_applications.append(applications)
+
+    def _offer_saving(self) -> Cents:
+        saving = 0
+        for product in self.offered:
+            quantity = self.remaining[product]
+            if quantity > 0:
+                discount = self.offers[product](quantity, self.prices)
+                if discount is not None:
+                    saving -= discount.discount_cents
+        return saving
+
+    def _offer_bound(self) -> Cents:
+        bound = 0
+        for product in self.offered:
+            quantity = self.remaining[product]
+            if quantity > 0:
+                discount = self.offers[product](quantity, self.prices)
+                if discount is not None and discount.discount_cents < 0:
+                    bound -= discount.discount_cents
+        return bound
+
+    def _search(self, index: int, saving: Cents) -> None:
+        self.steps += 1 + len(self.offered) + len(self.bundles) - index
+        if index == len(self.bundles):
+            saving += self._offer_saving()
+            if saving > self.best_saving:
+                self.best_saving = saving
+                self.best_applications = list(self.applications)
+            return
+
+        bound = saving + self._offer_bound()
+        for bundle in self.bundles[index:]:
+            bound += bundle.saving_cents(
+                bundle.applications_in(self.remaining), self.prices
+            )
+        if bound <= self.best_saving:
+            return
+
+        bundle = self.bundles[index]
+        scanned = [
+            (bundle_pq.product, bundle_pq.quantity, self.remaining[bundle_pq.product])
+            for bundle_pq in bundle.product_quantities
+        ]
+        for applications in range(bundle.applications_in(self.remaining), -1, -1):
+            for product, quantity, scanned_quantity in scanned:
+                self.remaining[product] = scanned_quantity - applications * quantity
+            self.applications[index] = applications
+            self._search(
+                index + 1, saving + bundle.saving_cents(applications, self.prices)
+            )
+            if self.steps >= self.step_limit:
+                break
+        for product, _, scanned_quantity in scanned:
+            self.remaining[product] = scanned_quantity
+        self.applications[index] = 0
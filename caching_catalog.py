@@ -0,0 +1,86 @@
+import math
+import time
+import typing
+from collections import OrderedDict
+
+from catalog import SupermarketCatalog
+from models.products import Product
+
+
+class CachingCatalog(SupermarketCatalog):
+    def __init__(
+        self,
+        catalog: SupermarketCatalog,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.catalog = catalog
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Product, tuple[float, float]] = OrderedDict()
+
+    def add_product(self, product: Product, price: float) -> None:
+        self.catalog.add_product(product, price)
+        self.invalidate(product)
+
+    def unit_price(self, product: Product) -> float:
+        price = self._lookup(product)
+        if price is None:
+            price = self.catalog.unit_price(product)
+            self._store(product, price)
+        return price
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        prices = {}
+        missing = []
+        for product in products:
+            if product in prices:
+                continue
+            price = self._lookup(product)
+            if price is None:
+                missing.append(product)
+            prices[product] = price
+
+        if missing:
+            for product, price in self.catalog.unit_prices(missing).items():
+                prices[product] = price
+                self._store(product, price)
+        return prices
+
+    def invalidate(self, product: Product) -> None:
+        self._entries.pop(product, None)
+
+    def invalidate_all(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, product: Product) -> float | None:
+        entry = self._entries.get(product)
+        if entry is not None:
+            price, expires_at = entry
+            if self.ttl is None or self.clock() < expires_at:
+                self._entries.move_to_end(product)
+                self.hits += 1
+                return price
+            del self._entries[product]
+        self.misses += 1
+        return None
+
+    def _store(self, product: Product, price: float) -> None:
+        expires_at = math.inf if self.ttl is None else self.clock() + self.ttl
+        self._entries[product] = (price, expires_at)
+        self._entries.move_to_end(product)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
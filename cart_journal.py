@@ -0,0 +1,194 @@
+import os
+import struct
+import typing
+
+from models.products import Product, ProductUnit
+from shopping_cart import ShoppingCart
+
+MAGIC = b"SMCARTJL"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sH")
+COMPACT_EVERY = 1024
+
+PRODUCT = b"P"
+SCAN = b"S"
+SNAPSHOT = b"C"
+
+TAG = struct.Struct("<c")
+PRODUCT_HEADER = struct.Struct("<BH")
+SCAN_RECORD = struct.Struct("<I?d")
+SNAPSHOT_HEADER = struct.Struct("<I")
+
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+class CartJournal:
+    def __init__(
+        self,
+        path: str,
+        cart: ShoppingCart | None = None,
+        sync: bool = True,
+        compact_every: int = COMPACT_EVERY,
+    ) -> None:
+        if compact_every < 1:
+            raise ValueError("compact_every must be at least 1")
+        self.path = path
+        self.cart = cart if cart is not None else ShoppingCart()
+        self.sync = sync
+        self.compact_every = compact_every
+        self.scans = 0
+        self._products: typing.Dict[Product, int] = {}
+        self._fd: int | None = None
+        self.compact()
+        self.cart.add_listener(self._on_scan)
+
+    def __enter__(self) -> "CartJournal":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def compact(self) -> None:
+        products: typing.Dict[Product, int] = {}
+        buffer = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION))
+        items = self.cart.items
+        body = bytearray(SNAPSHOT)
+        body += SNAPSHOT_HEADER.pack(len(items))
+        for pq in items:
+            quantity = pq.quantity
+            body += SCAN_RECORD.pack(
+                _product_id(pq.product, products, buffer),
+                quantity.__class__ is int,
+                quantity,
+            )
+        buffer += body
+
+        temporary_path = self.path + ".tmp"
+        fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, buffer)
+            if self.sync:
+                _sync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temporary_path, self.path)
+        if self.sync and os.name == "posix":
+            _sync_directory(self.path)
+
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        self._products = products
+        self.scans = 0
+
+    def close(self) -> None:
+        if self._fd is None:
+            return
+        self.cart.remove_listener(self._on_scan)
+        os.close(self._fd)
+        self._fd = None
+
+    def discard(self) -> None:
+        self.close()
+        os.remove(self.path)
+
+    def _on_scan(self, product: Product, quantity: float) -> None:
+        if self.scans >= self.compact_every:
+            self.compact()
+            return
+        record = bytearray()
+        product_id = _product_id(product, self._products, record)
+        record += SCAN
+        record += SCAN_RECORD.pack(product_id, quantity.__class__ is int, quantity)
+        os.write(self._fd, record)
+        if self.sync:
+            _sync(self._fd)
+        self.scans += 1
+
+
+def resume_journal(
+    path: str,
+    sync: bool = True,
+    compact_every: int = COMPACT_EVERY,
+) -> CartJournal:
+    return CartJournal(path, read_cart(path), sync, compact_every)
+
+
+def read_cart(path: str) -> ShoppingCart:
+    with open(path, "rb") as file:
+        data = file.read()
+    cart = ShoppingCart()
+    for product, quantity in _scans(data):
+        if quantity < 0:
+            cart.void_item_quantity(product, -quantity)
+        else:
+            cart.add_item_quantity(product, quantity)
+    return cart
+
+
+def _scans(data: bytes) -> typing.Iterator[tuple[Product, float]]:
+    if len(data) < HEADER.size:
+        raise ValueError("truncated cart journal")
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a version {FORMAT_VERSION} cart journal")
+
+    products: list[Product] = []
+    offset = HEADER.size
+    end = len(data)
+    while offset < end:
+        start = offset
+        offset += TAG.size
+        tag = data[start:offset]
+        if tag == SCAN:
+            if offset + SCAN_RECORD.size > end:
+                return
+            product_id, is_int, quantity = SCAN_RECORD.unpack_from(data, offset)
+            offset += SCAN_RECORD.size
+            yield products[product_id], int(quantity) if is_int else quantity
+        elif tag == PRODUCT:
+            if offset + PRODUCT_HEADER.size > end:
+                return
+            unit, length = PRODUCT_HEADER.unpack_from(data, offset)
+            offset += PRODUCT_HEADER.size
+            if offset + length > end:
+                return
+            start = offset
+            offset += length
+            products.append(Product(data[start:offset].decode(), ProductUnit(unit)))
+        elif tag == SNAPSHOT:
+            if offset + SNAPSHOT_HEADER.size > end:
+                return
+            (count,) = SNAPSHOT_HEADER.unpack_from(data, offset)
+            offset += SNAPSHOT_HEADER.size
+            start = offset
+            offset += SCAN_RECORD.size * count
+            if offset > end:
+                return
+            for product_id, is_int, quantity in SCAN_RECORD.iter_unpack(
+                data[start:offset]
+            ):
+                yield products[product_id], int(quantity) if is_int else quantity
+        else:
+            raise ValueError(f"unknown record {tag!r} in cart journal")
+
+
+def _product_id(
+    product: Product, products: typing.Dict[Product, int], buffer: bytearray
+) -> int:
+    product_id = products.get(product)
+    if product_id is None:
+        product_id = products[product] = len(products)
+        name = product.name.encode()
+        buffer += PRODUCT
+        buffer += PRODUCT_HEADER.pack(product.unit.value, len(name))
+        buffer += name
+    return product_id
+
+
+def _sync_directory(path: str) -> None:
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
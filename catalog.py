@@ -1,6 +1,55 @@
+import typing
+
+from models.money import Cents, to_cents
+from models.products import Product
+
+
 class SupermarketCatalog:
     def add_product(self, product, price):
         raise Exception("cannot be called from a unit test - it accesses the database")
 
     def unit_price(self, product):
         raise Exception("cannot be called from a unit test - it accesses the database")
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        return {product: self.unit_price(product) for product in products}
+
+    def unit_prices_cents(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, Cents]:
+        return {
+            product: to_cents(price)
+            for product, price in self.unit_prices(products).items()
+        }
+
+
+class AsyncSupermarketCatalog(typing.Protocol):
+    async def unit_price(self, product: Product) -> float:
+        ...
+
+
+class InMemoryCatalog(SupermarketCatalog):
+    def __init__(self) -> None:
+        self.prices: typing.Dict[Product, float] = {}
+        self.prices_cents: typing.Dict[Product, Cents] = {}
+
+    def add_product(self, product: Product, price: float) -> None:
+        self.prices[product] = price
+        self.prices_cents[product] = to_cents(price)
+
+    def unit_price(self, product: Product) -> float:
+        return self.prices[product]
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        prices = self.prices
+        return {product: prices[product] for product in products}
+
+    def unit_prices_cents(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, Cents]:
+        prices_cents = self.prices_cents
+        return {product: prices_cents[product] for product in products}
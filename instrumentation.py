@@ -0,0 +1,139 @@
+import threading
+import time
+import typing
+
+from caching_catalog import CachingCatalog
+from catalog import SupermarketCatalog
+from models.money import Cents
+from models.products import Product
+from receipt import Receipt
+
+PHASES = ("prices", "lines", "bundles", "offers")
+
+
+class CheckoutTrace:
+    __slots__ = ("clock", "started", "last", "phase_seconds", "lines", "discounts")
+
+    def __init__(self, clock: typing.Callable[[], float]) -> None:
+        self.clock = clock
+        self.started = self.last = clock()
+        self.phase_seconds: typing.Dict[str, float] = {}
+        self.lines = 0
+        self.discounts = 0
+
+    def mark(self, phase: str) -> None:
+        now = self.clock()
+        self.phase_seconds[phase] = now - self.last
+        self.last = now
+
+    @property
+    def seconds(self) -> float:
+        return self.last - self.started
+
+
+CheckoutHook = typing.Callable[[CheckoutTrace], None]
+
+
+class CheckoutInstrumentation:
+    def __init__(self, clock: typing.Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.hooks: list[CheckoutHook] = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.lines = 0
+        self.discounts = 0
+        self.catalog_calls = 0
+        self.priced_products = 0
+        self.phase_seconds = dict.fromkeys(PHASES, 0.0)
+
+    def add_hook(self, hook: CheckoutHook) -> None:
+        self.hooks.append(hook)
+
+    def count_catalog_calls(self, calls: int = 1) -> None:
+        with self._lock:
+            self.catalog_calls += calls
+
+    def start(self) -> CheckoutTrace:
+        return CheckoutTrace(self.clock)
+
+    def finish(self, trace: CheckoutTrace, receipt: Receipt, priced: int) -> None:
+        trace.lines = len(receipt.items)
+        trace.discounts = len(receipt.discounts)
+        with self._lock:
+            self.checkouts += 1
+            self.lines += trace.lines
+            self.discounts += trace.discounts
+            self.priced_products += priced
+            for phase, seconds in trace.phase_seconds.items():
+                self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+        for hook in self.hooks:
+            hook(trace)
+
+
+class CountingCatalog(SupermarketCatalog):
+    def __init__(
+        self, catalog: SupermarketCatalog, instrumentation: CheckoutInstrumentation
+    ) -> None:
+        self.catalog = catalog
+        self.instrumentation = instrumentation
+        self.cache = catalog if isinstance(catalog, CachingCatalog) else None
+
+    def add_product(self, product: Product, price: float) -> None:
+        self.catalog.add_product(product, price)
+
+    def unit_price(self, product: Product) -> float:
+        if self.cache is None:
+            self.instrumentation.count_catalog_calls()
+            return self.catalog.unit_price(product)
+        misses = self.cache.misses
+        price = self.cache.unit_price(product)
+        self._count_misses(misses, False)
+        return price
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        if self.cache is not None:
+            misses = self.cache.misses
+            prices = self.cache.unit_prices(products)
+            self._count_misses(misses, True)
+            return prices
+        if not _overrides(self.catalog, "unit_prices"):
+            return super().unit_prices(products)
+        self.instrumentation.count_catalog_calls()
+        return self.catalog.unit_prices(products)
+
+    def unit_prices_cents(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, Cents]:
+        if self.cache is not None or not _overrides(self.catalog, "unit_prices_cents"):
+            return super().unit_prices_cents(products)
+        self.instrumentation.count_catalog_calls()
+        return self.catalog.unit_prices_cents(products)
+
+    def _count_misses(self, misses: int, batched: bool) -> None:
+        missed = self.cache.misses - misses
+        if not missed:
+            return
+        if batched and _overrides(self.cache.catalog, "unit_prices"):
+            missed = 1
+        self.instrumentation.count_catalog_calls(missed)
+
+
+def instrument_catalog(
+    catalog: SupermarketCatalog, instrumentation: CheckoutInstrumentation
+) -> SupermarketCatalog:
+    return CountingCatalog(uninstrument_catalog(catalog), instrumentation)
+
+
+def uninstrument_catalog(catalog: SupermarketCatalog) -> SupermarketCatalog:
+    if isinstance(catalog, CountingCatalog):
+        return catalog.catalog
+    return catalog
+
+
+def _overrides(catalog: SupermarketCatalog, method: str) -> bool:
+    return getattr(type(catalog), method) is not getattr(SupermarketCatalog, method)
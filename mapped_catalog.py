@@ -0,0 +1,136 @@
+import argparse
+import bisect
+import csv
+import mmap
+import os
+import struct
+import sys
+import typing
+
+from catalog import SupermarketCatalog
+from models.money import Cents, from_cents, to_cents
+from models.products import Product, ProductUnit
+
+MAGIC = b"SMCATLG\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHI")
+PRICE = struct.Struct("<Bq")
+
+
+class _Keys:
+    def __init__(
+        self, mapped: mmap.mmap, key_width: int, record_size: int, count: int
+    ) -> None:
+        self.mapped = mapped
+        self.key_width = key_width
+        self.record_size = record_size
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        start = HEADER.size + index * self.record_size
+        end = start + self.key_width
+        return self.mapped[start:end]
+
+
+class MappedCatalog(SupermarketCatalog):
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.key_width, self.count = HEADER.unpack_from(self._mapped)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mapped.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} catalog file")
+        self.record_size = self.key_width + PRICE.size
+        self._keys = _Keys(self._mapped, self.key_width, self.record_size, self.count)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "MappedCatalog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mapped.close()
+
+    def add_product(self, product: Product, price: float) -> None:
+        raise Exception("cannot add products to a memory-mapped catalog")
+
+    def unit_price(self, product: Product) -> float:
+        return from_cents(self._cents(product))
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        return {product: from_cents(self._cents(product)) for product in products}
+
+    def unit_prices_cents(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, Cents]:
+        return {product: self._cents(product) for product in products}
+
+    def _cents(self, product: Product) -> Cents:
+        key = product.name.encode()
+        if len(key) <= self.key_width:
+            key = key.ljust(self.key_width, b"\0")
+            index = bisect.bisect_left(self._keys, key)
+            if index < self.count and self._keys[index] == key:
+                unit, cents = PRICE.unpack_from(
+                    self._mapped,
+                    HEADER.size + index * self.record_size + self.key_width,
+                )
+                if unit == product.unit.value:
+                    return cents
+        raise KeyError(product)
+
+
+def write_mapped_catalog(
+    path: str, rows: typing.Iterable[tuple[str, str, float | str]]
+) -> int:
+    records = sorted(
+        (name.encode(), ProductUnit[unit].value, to_cents(price))
+        for name, unit, price in rows
+    )
+    for previous, record in zip(records, records[1:]):
+        if previous[0] == record[0]:
+            raise ValueError(f"duplicate product {record[0].decode()}")
+    key_width = max((len(key) for key, _, _ in records), default=0)
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, key_width, len(records)))
+        for key, unit, cents in records:
+            file.write(key.ljust(key_width, b"\0"))
+            file.write(PRICE.pack(unit, cents))
+    os.replace(temporary_path, path)
+    return len(records)
+
+
+def build_mapped_catalog(csv_path: str, path: str) -> int:
+    with open(csv_path, newline="") as file:
+        return write_mapped_catalog(
+            path,
+            ((row["name"], row["unit"], row["price"]) for row in csv.DictReader(file)),
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert a CSV price list into a memory-mapped catalog file."
+    )
+    parser.add_argument("prices", help="CSV with name,unit,price")
+    parser.add_argument("output", help="catalog file to write")
+    args = parser.parse_args(argv)
+
+    count = build_mapped_catalog(args.prices, args.output)
+    print(f"products={count}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+CENTS_PER_UNIT = 100
+ROUNDING_EPSILON = 1e-9
+HALF_UP = 0.5 + ROUNDING_EPSILON
+
+Cents = int
+
+
+def round_half_up(value: float) -> Cents:
+    if value.__class__ is int:
+        return value
+    if value >= 0:
+        return int(value + HALF_UP)
+    return -int(HALF_UP - value)
+
+
+def to_cents(amount: float | int | Decimal | str) -> Cents:
+    if amount.__class__ is float:
+        cents = amount * CENTS_PER_UNIT
+        nearest = round(cents)
+        if abs(cents - nearest) < ROUNDING_EPSILON:
+            return nearest
+        amount = repr(amount)
+    elif isinstance(amount, int):
+        return amount * CENTS_PER_UNIT
+    return int(
+        (Decimal(amount) * CENTS_PER_UNIT).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    )
+
+
+def from_cents(cents: Cents) -> float:
+    return cents / CENTS_PER_UNIT
+
+
+def format_cents(cents: Cents) -> str:
+    sign = "-" if cents < 0 else ""
+    units, cents = divmod(abs(cents), CENTS_PER_UNIT)
+    return f"{sign}{units}.{cents:02d}"
@@ -1,7 +1,10 @@
+import functools
+import itertools
 import math
+import typing
 from enum import Enum
 
-from catalog import SupermarketCatalog
+from models.money import Cents, from_cents, round_half_up, to_cents
 from models.products import Product, ProductQuantity
 
 
@@ -13,12 +16,31 @@ class SpecialOfferType(Enum):
 
 
 class Discount:
+    __slots__ = ("product", "description", "discount_cents")
+
     def __init__(
         self, product: Product, description: str, discount_amount: float
     ) -> None:
         self.product = product
         self.description = description
-        self.discount_amount = discount_amount
+        self.discount_cents = to_cents(discount_amount)
+
+    @classmethod
+    def from_cents(
+        cls, product: Product, description: str, discount_cents: Cents
+    ) -> "Discount":
+        discount = cls.__new__(cls)
+        discount.product = product
+        discount.description = description
+        discount.discount_cents = discount_cents
+        return discount
+
+    @property
+    def discount_amount(self) -> float:
+        return from_cents(self.discount_cents)
+
+
+_bundle_sequence = itertools.count()
 
 
 class Bundle:
@@ -31,29 +53,48 @@ class Bundle:
         self.offer_type = offer_type
         self.product_quantities = product_quantities
         self.argument = argument
+        self.sequence = next(_bundle_sequence)
+
+    def applications_in(self, items: typing.Dict[Product, float]) -> int:
+        applications = math.inf
+        for bundle_pq in self.product_quantities:
+            applications = min(
+                items.get(bundle_pq.product, 0) // bundle_pq.quantity, applications
+            )
+        return 0 if applications == math.inf else int(applications)
+
+    def discounts(
+        self, applications: int, prices: typing.Dict[Product, Cents]
+    ) -> list[Discount]:
+        if applications <= 0:
+            return []
+        if self.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
+            return self.ten_percent(applications, prices)
+        return []
+
+    def saving_cents(
+        self, applications: int, prices: typing.Dict[Product, Cents]
+    ) -> Cents:
+        return -sum(
+            discount.discount_cents for discount in self.discounts(applications, prices)
+        )
 
     def ten_percent(
-        self, items: dict[Product, int], catalog: SupermarketCatalog
+        self, applications: int, prices: typing.Dict[Product, Cents]
     ) -> list[Discount]:
         discounts = []
-
-        min_mult = math.inf
         for product_quantity in self.product_quantities:
-            if product_quantity.product in items.keys():
-                min_mult = min(
-                    items[product_quantity.product] // product_quantity.quantity,
-                    min_mult,
-                )
-        for product_quantity in self.product_quantities:
-            unit_price = catalog.unit_price(product_quantity.product)
-            discount = Discount(
+            unit_price = prices[product_quantity.product]
+            discount = Discount.from_cents(
                 product_quantity.product,
                 str(self.argument) + "% off",
-                -min_mult
-                * product_quantity.quantity
-                * unit_price
-                * self.argument
-                / 100.0,
+                -round_half_up(
+                    applications
+                    * product_quantity.quantity
+                    * unit_price
+                    * self.argument
+                    / 100
+                ),
             )
             discounts.append(discount)
 
@@ -67,33 +108,106 @@ class Offer:
         self.offer_type = offer_type
         self.product = product
         self.argument = argument
+        self.argument_cents = None if argument is None else to_cents(argument)
+
+    @functools.cached_property
+    def description(self) -> str:
+        return OFFER_RULES[self.offer_type].describe(self)
+
+    def compile(self) -> "CompiledOffer":
+        rule = OFFER_RULES[self.offer_type]
+        minimum_quantity = rule.minimum_quantity
+        discount = rule.discount
+
+        def apply(
+            quantity: float, prices: typing.Dict[Product, Cents]
+        ) -> Discount | None:
+            if quantity >= minimum_quantity:
+                return discount(self, quantity, prices)
+            return None
+
+        return apply
+
+    def three_per_due(
+        self, quantity: float, prices: typing.Dict[Product, Cents]
+    ) -> Discount:
+        unit_price = prices[self.product]
+        free_items = quantity // 3
+        return Discount.from_cents(
+            self.product, self.description, -round_half_up(free_items * unit_price)
+        )
 
-    def three_per_due(self, quantity: float, catalog: SupermarketCatalog) -> Discount:
-        unit_price = catalog.unit_price(self.product)
-        quotient = quantity // 3
-        discount_amount = quantity * unit_price - (
-            (quotient * 2 * unit_price) + quantity % 3 * unit_price
+    def two_for_amount(
+        self, quantity: float, prices: typing.Dict[Product, Cents]
+    ) -> Discount:
+        unit_price = prices[self.product]
+        saving = 2 * unit_price - self.argument_cents
+        return Discount.from_cents(
+            self.product, self.description, -round_half_up(quantity // 2 * saving)
         )
-        return Discount(self.product, "3 for 2", -discount_amount)
-
-    def two_for_amount(self, quantity: float, catalog: SupermarketCatalog) -> Discount:
-        unit_price = catalog.unit_price(self.product)
-        total = self.argument * (quantity // 2) + quantity % 2 * unit_price
-        discount_n = unit_price * quantity - total
-        return Discount(self.product, "2 for " + str(self.argument), -discount_n)
-
-    def five_for_amount(self, quantity: float, catalog: SupermarketCatalog) -> Discount:
-        unit_price = catalog.unit_price(self.product)
-        quotient = quantity // 5
-        discount_total = unit_price * quantity - (
-            self.argument * quotient + quantity % 5 * unit_price
+
+    def five_for_amount(
+        self, quantity: float, prices: typing.Dict[Product, Cents]
+    ) -> Discount:
+        unit_price = prices[self.product]
+        saving = 5 * unit_price - self.argument_cents
+        return Discount.from_cents(
+            self.product, self.description, -round_half_up(quantity // 5 * saving)
         )
-        return Discount(self.product, "5 for " + str(self.argument), -discount_total)
 
-    def ten_percent(self, quantity: float, catalog: SupermarketCatalog) -> Discount:
-        unit_price = catalog.unit_price(self.product)
-        return Discount(
+    def ten_percent(
+        self, quantity: float, prices: typing.Dict[Product, Cents]
+    ) -> Discount:
+        unit_price = prices[self.product]
+        return Discount.from_cents(
             self.product,
-            str(self.argument) + "% off",
-            -quantity * unit_price * self.argument / 100.0,
+            self.description,
+            -round_half_up(quantity * unit_price * self.argument / 100),
         )
+
+
+CompiledOffer = typing.Callable[
+    [float, typing.Dict[Product, Cents]], typing.Optional[Discount]
+]
+OfferDiscount = typing.Callable[[Offer, float, typing.Dict[Product, Cents]], Discount]
+
+
+class OfferRule:
+    def __init__(
+        self,
+        minimum_quantity: float,
+        discount: OfferDiscount,
+        describe: typing.Callable[[Offer], str],
+    ) -> None:
+        self.minimum_quantity = minimum_quantity
+        self.discount = discount
+        self.describe = describe
+
+
+OFFER_RULES: typing.Dict[typing.Hashable, OfferRule] = {}
+
+
+def register_offer_rule(
+    offer_type: typing.Hashable,
+    describe: typing.Callable[[Offer], str],
+    minimum_quantity: float = -math.inf,
+) -> typing.Callable[[OfferDiscount], OfferDiscount]:
+    def register(discount: OfferDiscount) -> OfferDiscount:
+        OFFER_RULES[offer_type] = OfferRule(minimum_quantity, discount, describe)
+        return discount
+
+    return register
+
+
+register_offer_rule(SpecialOfferType.THREE_FOR_TWO, lambda offer: "3 for 2", 3)(
+    Offer.three_per_due
+)
+register_offer_rule(
+    SpecialOfferType.TWO_FOR_AMOUNT, lambda offer: "2 for " + str(offer.argument), 2
+)(Offer.two_for_amount)
+register_offer_rule(
+    SpecialOfferType.FIVE_FOR_AMOUNT, lambda offer: "5 for " + str(offer.argument), 5
+)(Offer.five_for_amount)
+register_offer_rule(
+    SpecialOfferType.TEN_PERCENT_DISCOUNT, lambda offer: str(offer.argument) + "% off"
+)(Offer.ten_percent)
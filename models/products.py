@@ -7,12 +7,37 @@ class ProductUnit(Enum):
 
 
 class Product:
+    __slots__ = ("name", "unit", "_hash")
+
     def __init__(self, name: str, unit: ProductUnit) -> None:
-        self.name = name
-        self.unit = unit
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "unit", unit)
+        object.__setattr__(self, "_hash", hash((name, unit)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to Product.{name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete Product.{name}")
+
+    def __reduce__(self) -> tuple[type, tuple[str, ProductUnit]]:
+        return Product, (self.name, self.unit)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Product):
+            return NotImplemented
+        return self is other or (self.name == other.name and self.unit == other.unit)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Product({self.name!r}, {self.unit})"
 
 
 class ProductQuantity:
+    __slots__ = ("product", "quantity")
+
     def __init__(self, product: Product, quantity: float) -> None:
         self.product = product
         self.quantity = quantity
@@ -0,0 +1,106 @@
+import bisect
+import time
+import typing
+from array import array
+
+from catalog import InMemoryCatalog, SupermarketCatalog
+from models.money import Cents, from_cents, to_cents
+from models.products import Product
+
+
+class _PriceHistory:
+    __slots__ = ("times", "prices")
+
+    def __init__(self) -> None:
+        self.times = array("d")
+        self.prices = array("q")
+
+    @property
+    def current(self) -> Cents:
+        return self.prices[-1]
+
+    def append(self, at: float, cents: Cents) -> None:
+        if self.times and at < self.times[-1]:
+            raise ValueError("price changes must be recorded in time order")
+        self.times.append(at)
+        self.prices.append(cents)
+
+    def cents_at(self, at: float) -> Cents | None:
+        index = bisect.bisect_right(self.times, at) - 1
+        if index < 0:
+            return None
+        return self.prices[index]
+
+
+class PriceHistoryCatalog(SupermarketCatalog):
+    def __init__(self, clock: typing.Callable[[], float] = time.time) -> None:
+        self.clock = clock
+        self._histories: typing.Dict[Product, _PriceHistory] = {}
+
+    def add_product(
+        self, product: Product, price: float, at: float | None = None
+    ) -> None:
+        history = self._histories.get(product)
+        if history is None:
+            history = self._histories[product] = _PriceHistory()
+        history.append(self.clock() if at is None else at, to_cents(price))
+
+    def changes(self, product: Product) -> int:
+        history = self._histories.get(product)
+        return 0 if history is None else len(history.times)
+
+    def unit_price(self, product: Product, at: float | None = None) -> float:
+        return from_cents(self._cents(product, at))
+
+    def unit_prices(
+        self, products: typing.Iterable[Product], at: float | None = None
+    ) -> typing.Dict[Product, float]:
+        return {product: from_cents(self._cents(product, at)) for product in products}
+
+    def unit_prices_cents(
+        self, products: typing.Iterable[Product], at: float | None = None
+    ) -> typing.Dict[Product, Cents]:
+        return {product: self._cents(product, at) for product in products}
+
+    def as_of(self, at: float) -> "PointInTimeCatalog":
+        return PointInTimeCatalog(self, at)
+
+    def snapshot(self, at: float) -> InMemoryCatalog:
+        catalog = InMemoryCatalog()
+        for product, history in self._histories.items():
+            cents = history.cents_at(at)
+            if cents is not None:
+                catalog.add_product(product, from_cents(cents))
+        return catalog
+
+    def _cents(self, product: Product, at: float | None) -> Cents:
+        history = self._histories.get(product)
+        if history is not None:
+            if at is None:
+                return history.current
+            cents = history.cents_at(at)
+            if cents is not None:
+                return cents
+        raise KeyError(product)
+
+
+class PointInTimeCatalog(SupermarketCatalog):
+    def __init__(self, history: PriceHistoryCatalog, at: float) -> None:
+        self.history = history
+        self.at = at
+
+    def add_product(self, product: Product, price: float) -> None:
+        raise Exception("cannot change prices in the past")
+
+    def unit_price(self, product: Product) -> float:
+        return self.history.unit_price(product, self.at)
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        return self.history.unit_prices(products, self.at)
+
+    def unit_prices_cents(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, Cents]:
+        return self.history.unit_prices_cents(products, self.at)
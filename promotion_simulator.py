@@ -0,0 +1,155 @@
+import typing
+
+import numpy as np
+
+from batch_checkout import VECTOR_OFFERS
+from bundle_allocation import allocate_bundles
+from catalog import SupermarketCatalog
+from models.money import Cents, from_cents, round_half_up
+from models.offers import Bundle, Offer
+from models.products import Product
+from receipt import ReceiptLineMode
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+Configure = typing.Callable[[Teller], None]
+
+
+class ScenarioResult:
+    def __init__(
+        self, name: str, baskets: int, gross_cents: Cents, discount_cents: Cents
+    ) -> None:
+        self.name = name
+        self.baskets = baskets
+        self.gross_cents = gross_cents
+        self.discount_cents = discount_cents
+
+    @property
+    def total_cents(self) -> Cents:
+        return self.gross_cents + self.discount_cents
+
+    @property
+    def discount_cost(self) -> float:
+        return -from_cents(self.discount_cents)
+
+    @property
+    def average_basket(self) -> float:
+        return from_cents(self.total_cents) / self.baskets if self.baskets else 0.0
+
+
+class PromotionSimulator:
+    def __init__(
+        self,
+        catalog: SupermarketCatalog,
+        carts: typing.Iterable[ShoppingCart],
+        line_mode: ReceiptLineMode = ReceiptLineMode.ITEMIZED,
+    ) -> None:
+        self.catalog = catalog
+        self.line_mode = line_mode
+        self.baskets: list[typing.Dict[Product, float]] = []
+        indexes: typing.Dict[Product, list[int]] = {}
+        quantities: typing.Dict[Product, list[float]] = {}
+        lines: list[tuple[Product, float]] = []
+        for cart in carts:
+            basket = dict(cart.product_quantities)
+            for product, quantity in basket.items():
+                indexes.setdefault(product, []).append(len(self.baskets))
+                quantities.setdefault(product, []).append(quantity)
+            if line_mode == ReceiptLineMode.AGGREGATED:
+                lines.extend(basket.items())
+            else:
+                lines.extend((pq.product, pq.quantity) for pq in cart.items)
+            self.baskets.append(basket)
+
+        self.prices = catalog.unit_prices_cents(
+            dict.fromkeys(product for product, _ in lines).keys()
+        )
+        self.gross_cents = sum(
+            round_half_up(quantity * self.prices[product])
+            for product, quantity in lines
+        )
+        self._indexes = {
+            product: np.array(basket_indexes, dtype=np.intp)
+            for product, basket_indexes in indexes.items()
+        }
+        self._quantities = {
+            product: np.array(product_quantities, dtype=np.float64)
+            for product, product_quantities in quantities.items()
+        }
+
+    def simulate(self, configure: Configure, name: str = "") -> ScenarioResult:
+        teller = Teller(self.catalog, self.line_mode)
+        configure(teller)
+        table = teller.offer_table
+
+        discount_cents = 0
+        remaining: typing.Dict[Product, typing.Dict[int, float]] = {}
+        for basket_index in self._bundle_baskets(table.bundles):
+            basket = self.baskets[basket_index]
+            allocation = allocate_bundles(
+                (
+                    bundle
+                    for product in basket
+                    for bundle in table.bundles.get(product, ())
+                ),
+                basket,
+                table.compiled_offers,
+                self.prices,
+            )
+            for bundle, applications in allocation.applications.items():
+                discount_cents -= bundle.saving_cents(applications, self.prices)
+            for product, quantity in allocation.remaining.items():
+                remaining.setdefault(product, {})[basket_index] = quantity
+
+        for product, offer in table.offers.items():
+            quantities = self._quantities.get(product)
+            if quantities is None:
+                continue
+            if product in remaining:
+                quantities = quantities.copy()
+                positions = np.searchsorted(
+                    self._indexes[product], list(remaining[product])
+                )
+                quantities[positions] = list(remaining[product].values())
+            discount_cents += self._offer_cents(offer, quantities[quantities > 0])
+
+        return ScenarioResult(name, len(self.baskets), self.gross_cents, discount_cents)
+
+    def simulate_many(
+        self, scenarios: typing.Dict[str, Configure]
+    ) -> list[ScenarioResult]:
+        return [self.simulate(configure, name) for name, configure in scenarios.items()]
+
+    def _bundle_baskets(
+        self, bundles: typing.Dict[Product, typing.Sequence[Bundle]]
+    ) -> list[int]:
+        indexes = [
+            self._indexes[product] for product in bundles if product in self._indexes
+        ]
+        if not indexes:
+            return []
+        return np.unique(np.concatenate(indexes)).tolist()
+
+    def _offer_cents(self, offer: Offer, quantities: np.ndarray) -> Cents:
+        vector_offer = VECTOR_OFFERS.get(offer.offer_type)
+        if vector_offer is None:
+            compiled_offer = offer.compile()
+            discount_cents = 0
+            for quantity in quantities.tolist():
+                discount = compiled_offer(quantity, self.prices)
+                if discount is not None:
+                    discount_cents += discount.discount_cents
+            return discount_cents
+
+        minimum_quantity, amounts_of = vector_offer
+        quantities = quantities[quantities >= minimum_quantity]
+        count = len(quantities)
+        argument = 0.0 if offer.argument is None else offer.argument
+        return int(
+            amounts_of(
+                quantities,
+                np.full(count, self.prices[offer.product], dtype=np.int64),
+                np.full(count, argument, dtype=np.float64),
+                np.full(count, offer.argument_cents or 0, dtype=np.int64),
+            ).sum()
+        )
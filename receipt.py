@@ -1,86 +1,96 @@
 import typing
+from enum import Enum
 
-from catalog import SupermarketCatalog
-from models.offers import Bundle, Discount, Offer, SpecialOfferType
+from models.money import Cents, from_cents, to_cents
+from models.offers import Bundle, Discount
 from models.products import Product
 
 
+class ReceiptLineMode(Enum):
+    ITEMIZED = 1
+    AGGREGATED = 2
+
+
 class ReceiptItem:
+    __slots__ = ("product", "quantity", "price_cents", "total_cents")
+
     def __init__(
-        self, product: Product, quantity: float, price: float, total_price: float
+        self, product: Product, quantity: float, price_cents: Cents, total_cents: Cents
     ) -> None:
         self.product = product
         self.quantity = quantity
-        self.price = price
-        self.total_price = total_price
+        self.price_cents = price_cents
+        self.total_cents = total_cents
+
+    @property
+    def price(self) -> float:
+        return from_cents(self.price_cents)
+
+    @property
+    def total_price(self) -> float:
+        return from_cents(self.total_cents)
 
 
 class Receipt:
     def __init__(self) -> None:
         self._items = []
         self._discounts = []
+        self._items_view: tuple[ReceiptItem, ...] | None = ()
+        self._discounts_view: tuple[Discount, ...] | None = ()
 
     def total_price(self) -> float:
-        total: float = 0
-        for item in self.items:
-            total += item.total_price
-        for discount in self.discounts:
-            total += discount.discount_amount
+        return from_cents(self.total_cents())
+
+    def total_cents(self) -> Cents:
+        total = 0
+        for item in self._items:
+            total += item.total_cents
+        for discount in self._discounts:
+            total += discount.discount_cents
         return total
 
     def add_product(
         self, product: Product, quantity: float, price: float, total_price: float
     ) -> None:
-        self._items.append(ReceiptItem(product, quantity, price, total_price))
+        self._items.append(
+            ReceiptItem(product, quantity, to_cents(price), to_cents(total_price))
+        )
+        self._items_view = None
+
+    def add_items(self, items: typing.Iterable[ReceiptItem]) -> None:
+        self._items.extend(items)
+        self._items_view = None
 
     def add_discount(self, discount: Discount) -> None:
         self._discounts.append(discount)
+        self._discounts_view = None
 
     def add_discounts(self, discounts: list[Discount]) -> None:
         self._discounts += discounts
+        self._discounts_view = None
 
     @property
-    def items(self) -> list[ReceiptItem]:
-        return self._items[:]
+    def items(self) -> tuple[ReceiptItem, ...]:
+        if self._items_view is None:
+            self._items_view = tuple(self._items)
+        return self._items_view
 
     @property
-    def discounts(self) -> list[Discount]:
-        return self._discounts[:]
+    def discounts(self) -> tuple[Discount, ...]:
+        if self._discounts_view is None:
+            self._discounts_view = tuple(self._discounts)
+        return self._discounts_view
 
-    def manage_offer(
-        self, offer: Offer, quantity: float, catalog: SupermarketCatalog
-    ) -> None:
-        discount = None
-        if offer.offer_type == SpecialOfferType.THREE_FOR_TWO and quantity >= 3:
-            discount = offer.three_per_due(quantity, catalog)
-        if offer.offer_type == SpecialOfferType.TWO_FOR_AMOUNT and quantity >= 2:
-            discount = offer.two_for_amount(quantity, catalog)
-        if offer.offer_type == SpecialOfferType.FIVE_FOR_AMOUNT and quantity >= 5:
-            discount = offer.five_for_amount(quantity, catalog)
-        if offer.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
-            discount = offer.ten_percent(quantity, catalog)
-        if discount:
-            self.add_discount(discount)
+    def iter_items(self) -> typing.Iterator[ReceiptItem]:
+        return iter(self._items)
+
+    def iter_discounts(self) -> typing.Iterator[Discount]:
+        return iter(self._discounts)
 
     def manage_bundle(
         self,
         bundle: Bundle,
-        product_quantities: typing.Dict[Product, int],
-        catalog: SupermarketCatalog,
+        applications: int,
+        prices: typing.Dict[Product, Cents],
     ) -> None:
-        discounts = []
-        completed = True
-        for bundle_pq in bundle.product_quantities:
-            if (
-                bundle_pq.product in product_quantities.keys()
-                and bundle_pq.quantity <= product_quantities[bundle_pq.product]
-            ):
-                continue
-            completed = False
-            break
-
-        if completed:
-            if bundle.offer_type == SpecialOfferType.TEN_PERCENT_DISCOUNT:
-                discounts = bundle.ten_percent(product_quantities, catalog)
-
-        self.add_discounts(discounts)
+        self.add_discounts(bundle.discounts(applications, prices))
@@ -0,0 +1,159 @@
+import struct
+import typing
+
+from models.offers import Discount
+from models.products import Product, ProductUnit
+from receipt import Receipt, ReceiptItem
+
+MAGIC = b"SMRCARCH"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sH")
+
+BATCH = b"B"
+PRODUCT = b"P"
+TEXT = b"T"
+RECEIPT = b"R"
+
+TAG = struct.Struct("<c")
+PRODUCT_HEADER = struct.Struct("<BH")
+TEXT_HEADER = struct.Struct("<H")
+RECEIPT_HEADER = struct.Struct("<II")
+ITEM = struct.Struct("<I?dqq")
+DISCOUNT = struct.Struct("<IIq")
+
+
+class ReceiptArchiveWriter:
+    def __init__(self, stream: typing.BinaryIO, batch_size: int = 1024) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.stream = stream
+        self.batch_size = batch_size
+        self.receipts = 0
+        self._products: typing.Dict[Product, int] = {}
+        self._texts: typing.Dict[str, int] = {}
+        stream.write(HEADER.pack(MAGIC, FORMAT_VERSION))
+
+    def __enter__(self) -> "ReceiptArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stream.flush()
+
+    def write(self, receipt: Receipt) -> None:
+        if self.receipts % self.batch_size == 0:
+            self._products.clear()
+            self._texts.clear()
+            buffer = bytearray(BATCH)
+        else:
+            buffer = bytearray()
+
+        items = receipt.items
+        discounts = receipt.discounts
+        body = bytearray(RECEIPT)
+        body += RECEIPT_HEADER.pack(len(items), len(discounts))
+        for item in items:
+            quantity = item.quantity
+            body += ITEM.pack(
+                self._product_id(item.product, buffer),
+                quantity.__class__ is int,
+                quantity,
+                item.price_cents,
+                item.total_cents,
+            )
+        for discount in discounts:
+            body += DISCOUNT.pack(
+                self._product_id(discount.product, buffer),
+                self._text_id(discount.description, buffer),
+                discount.discount_cents,
+            )
+        buffer += body
+        self.stream.write(buffer)
+        self.receipts += 1
+
+    def write_all(self, receipts: typing.Iterable[Receipt]) -> None:
+        for receipt in receipts:
+            self.write(receipt)
+
+    def _product_id(self, product: Product, buffer: bytearray) -> int:
+        product_id = self._products.get(product)
+        if product_id is None:
+            product_id = self._products[product] = len(self._products)
+            name = product.name.encode()
+            buffer += PRODUCT
+            buffer += PRODUCT_HEADER.pack(product.unit.value, len(name))
+            buffer += name
+        return product_id
+
+    def _text_id(self, text: str, buffer: bytearray) -> int:
+        text_id = self._texts.get(text)
+        if text_id is None:
+            text_id = self._texts[text] = len(self._texts)
+            encoded = text.encode()
+            buffer += TEXT
+            buffer += TEXT_HEADER.pack(len(encoded))
+            buffer += encoded
+        return text_id
+
+
+def read_receipts(stream: typing.BinaryIO) -> typing.Iterator[Receipt]:
+    magic, version = HEADER.unpack(_read(stream, HEADER.size))
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not a version {FORMAT_VERSION} receipt archive")
+
+    products: list[Product] = []
+    texts: list[str] = []
+    while True:
+        tag = stream.read(TAG.size)
+        if not tag:
+            return
+        if tag == BATCH:
+            products.clear()
+            texts.clear()
+        elif tag == PRODUCT:
+            unit, length = PRODUCT_HEADER.unpack(_read(stream, PRODUCT_HEADER.size))
+            products.append(Product(_read(stream, length).decode(), ProductUnit(unit)))
+        elif tag == TEXT:
+            (length,) = TEXT_HEADER.unpack(_read(stream, TEXT_HEADER.size))
+            texts.append(_read(stream, length).decode())
+        elif tag == RECEIPT:
+            yield _read_receipt(stream, products, texts)
+        else:
+            raise ValueError(f"unknown record {tag!r} in receipt archive")
+
+
+def _read_receipt(
+    stream: typing.BinaryIO, products: list[Product], texts: list[str]
+) -> Receipt:
+    item_count, discount_count = RECEIPT_HEADER.unpack(
+        _read(stream, RECEIPT_HEADER.size)
+    )
+    receipt = Receipt()
+    items = []
+    for product_id, is_int, quantity, price_cents, total_cents in ITEM.iter_unpack(
+        _read(stream, ITEM.size * item_count)
+    ):
+        items.append(
+            ReceiptItem(
+                products[product_id],
+                int(quantity) if is_int else quantity,
+                price_cents,
+                total_cents,
+            )
+        )
+    receipt.add_items(items)
+    discounts = []
+    for product_id, text_id, discount_cents in DISCOUNT.iter_unpack(
+        _read(stream, DISCOUNT.size * discount_count)
+    ):
+        discounts.append(
+            Discount.from_cents(products[product_id], texts[text_id], discount_cents)
+        )
+    receipt.add_discounts(discounts)
+    return receipt
+
+
+def _read(stream: typing.BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("truncated receipt archive")
+    return data
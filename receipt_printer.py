@@ -1,46 +1,112 @@
+import time
+import typing
+
+from models.money import Cents, format_cents, to_cents
 from models.offers import Discount
 from models.products import ProductUnit
 from receipt import Receipt, ReceiptItem
 
+CACHE_SIZE = 4096
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+Write = typing.Callable[[str], object]
+
+
+class FormatCache(typing.Dict[K, V]):
+    def __init__(self, size: int = CACHE_SIZE) -> None:
+        super().__init__()
+        self.size = size
+
+    def store(self, key: K, value: V) -> V:
+        if len(self) >= self.size:
+            self.clear()
+        self[key] = value
+        return value
+
+
+class PrintStats:
+    def __init__(self) -> None:
+        self.receipts = 0
+        self.lines = 0
+        self.seconds = 0.0
+
+    @property
+    def receipts_per_second(self) -> float:
+        return self.receipts / self.seconds if self.seconds else 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.seconds if self.seconds else 0.0
+
 
 class ReceiptPrinter:
-    def __init__(self, columns: int = 40) -> None:
+    def __init__(self, columns: int = 40, cache_size: int = CACHE_SIZE) -> None:
         self.columns = columns
+        self.stats = PrintStats()
+        self._columns: FormatCache[tuple[str, int], str] = FormatCache(cache_size)
+        self._amounts: FormatCache[Cents, str] = FormatCache(cache_size)
+        self._quantities: FormatCache[
+            tuple[Cents, float, type, ProductUnit], str
+        ] = FormatCache(cache_size)
 
     def print_receipt(self, receipt: Receipt) -> str:
-        result = ""
-        for item in receipt.items:
-            receipt_item = self.print_receipt_item(item)
-            result += receipt_item
+        parts: list[str] = []
+        self.layout(receipt, parts.append)
+        return "".join(parts)
 
-        for discount in receipt.discounts:
-            discount_presentation = self.print_discount(discount)
-            result += discount_presentation
+    def write_receipt(self, receipt: Receipt, stream: typing.TextIO) -> None:
+        self.layout(receipt, stream.write)
 
-        result += "\n"
-        result += self.present_total(receipt)
-        return str(result)
+    def print_receipts(
+        self, receipts: typing.Iterable[Receipt]
+    ) -> typing.Iterator[str]:
+        stats = self.stats
+        clock = time.perf_counter
+        for receipt in receipts:
+            start = clock()
+            parts: list[str] = []
+            lines = self.layout(receipt, parts.append)
+            printed = "".join(parts)
+            stats.seconds += clock() - start
+            stats.receipts += 1
+            stats.lines += lines
+            yield printed
+
+    def layout(self, receipt: Receipt, write: Write) -> int:
+        lines = self.layout_lines(receipt, write)
+        write("\n")
+        self.layout_total(receipt, write)
+        return lines
+
+    def layout_lines(self, receipt: Receipt, write: Write) -> int:
+        lines = 0
+        for item in receipt.iter_items():
+            self._layout_item(item, write)
+            lines += 1
+        for discount in receipt.iter_discounts():
+            self._layout_discount(discount, write)
+            lines += 1
+        return lines
+
+    def layout_total(self, receipt: Receipt, write: Write) -> None:
+        self._layout_line("Total: ", receipt.total_cents(), write)
 
     def print_receipt_item(self, item: ReceiptItem) -> str:
-        total_price_printed = self.print_price(item.total_price)
-        name = item.product.name
-        line = self.format_line_with_whitespace(name, total_price_printed)
-        if item.quantity != 1:
-            line += f"  {self.print_price(item.price)} * {self.print_quantity(item)}\n"
-        return line
+        parts: list[str] = []
+        self._layout_item(item, parts.append)
+        return "".join(parts)
 
     def format_line_with_whitespace(self, name: str, value: str) -> str:
-        line: str = name
-        whitespace_size = self.columns - len(name) - len(value)
-        for _ in range(whitespace_size):
-            line += " "
-        line += value
-        line += "\n"
-        return line
+        return self._column(name, len(value)) + value + "\n"
 
     @staticmethod
     def print_price(price: float) -> str:
-        return "%.2f" % price
+        return format_cents(to_cents(price))
+
+    @staticmethod
+    def print_cents(cents: Cents) -> str:
+        return format_cents(cents)
 
     @staticmethod
     def print_quantity(item: ReceiptItem) -> str:
@@ -50,11 +116,46 @@ class ReceiptPrinter:
             return "%.3f" % item.quantity
 
     def print_discount(self, discount: Discount) -> str:
-        name = f"{discount.description} ({discount.product.name})"
-        value = self.print_price(discount.discount_amount)
-        return self.format_line_with_whitespace(name, value)
+        parts: list[str] = []
+        self._layout_discount(discount, parts.append)
+        return "".join(parts)
 
     def present_total(self, receipt: Receipt) -> str:
-        name = "Total: "
-        value = self.print_price(receipt.total_price())
-        return self.format_line_with_whitespace(name, value)
+        parts: list[str] = []
+        self.layout_total(receipt, parts.append)
+        return "".join(parts)
+
+    def _layout_item(self, item: ReceiptItem, write: Write) -> None:
+        self._layout_line(item.product.name, item.total_cents, write)
+        quantity = item.quantity
+        if quantity != 1:
+            key = (item.price_cents, quantity, type(quantity), item.product.unit)
+            line = self._quantities.get(key)
+            if line is None:
+                line = self._quantities.store(
+                    key,
+                    f"  {self.print_cents(item.price_cents)} * "
+                    f"{self.print_quantity(item)}\n",
+                )
+            write(line)
+
+    def _layout_discount(self, discount: Discount, write: Write) -> None:
+        self._layout_line(
+            f"{discount.description} ({discount.product.name})",
+            discount.discount_cents,
+            write,
+        )
+
+    def _layout_line(self, name: str, cents: Cents, write: Write) -> None:
+        amount = self._amounts.get(cents)
+        if amount is None:
+            amount = self._amounts.store(cents, self.print_cents(cents) + "\n")
+        write(self._column(name, len(amount) - 1))
+        write(amount)
+
+    def _column(self, name: str, width: int) -> str:
+        key = (name, width)
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns.store(key, name.ljust(self.columns - width))
+        return column
@@ -0,0 +1,170 @@
+import abc
+import json
+import typing
+
+from models.money import Cents, format_cents
+from models.products import Product
+from receipt import Receipt, ReceiptItem
+from receipt_printer import CACHE_SIZE, FormatCache, ReceiptPrinter
+
+
+class ReceiptRenderer(abc.ABC):
+    media_type = "application/octet-stream"
+
+    @abc.abstractmethod
+    def render_into(self, receipt: Receipt, buffer: bytearray) -> None:
+        ...
+
+    def render(self, receipt: Receipt) -> bytes:
+        buffer = bytearray()
+        self.render_into(receipt, buffer)
+        return bytes(buffer)
+
+
+class TextRenderer(ReceiptRenderer):
+    media_type = "text/plain"
+
+    def __init__(
+        self,
+        columns: int = 40,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        cache_size: int = CACHE_SIZE,
+    ) -> None:
+        self.columns = columns
+        self.encoding = encoding
+        self.errors = errors
+        self.printer = ReceiptPrinter(columns, cache_size)
+
+    def render_into(self, receipt: Receipt, buffer: bytearray) -> None:
+        parts: list[str] = []
+        self.printer.layout_lines(receipt, parts.append)
+        parts.append("\n")
+        self._write(parts, buffer)
+        self._write_total(receipt, buffer)
+
+    def _write_total(self, receipt: Receipt, buffer: bytearray) -> None:
+        parts: list[str] = []
+        self.printer.layout_total(receipt, parts.append)
+        self._write(parts, buffer)
+
+    def _write(self, parts: list[str], buffer: bytearray) -> None:
+        buffer += "".join(parts).encode(self.encoding, self.errors)
+
+
+class EscPosRenderer(TextRenderer):
+    media_type = "application/vnd.escpos"
+
+    INITIALIZE = b"\x1b@"
+    BOLD_ON = b"\x1bE\x01"
+    BOLD_OFF = b"\x1bE\x00"
+    FEED_AND_CUT = b"\x1bd\x03\x1dV\x01"
+
+    def __init__(
+        self,
+        columns: int = 42,
+        encoding: str = "cp437",
+        errors: str = "replace",
+        cache_size: int = CACHE_SIZE,
+    ) -> None:
+        super().__init__(columns, encoding, errors, cache_size)
+
+    def render_into(self, receipt: Receipt, buffer: bytearray) -> None:
+        buffer += self.INITIALIZE
+        super().render_into(receipt, buffer)
+        buffer += self.FEED_AND_CUT
+
+    def _write_total(self, receipt: Receipt, buffer: bytearray) -> None:
+        buffer += self.BOLD_ON
+        super()._write_total(receipt, buffer)
+        buffer += self.BOLD_OFF
+
+
+class JsonRenderer(ReceiptRenderer):
+    media_type = "application/json"
+
+    def __init__(self, cache_size: int = CACHE_SIZE) -> None:
+        self._encode = json.JSONEncoder(ensure_ascii=False).encode
+        self._products: FormatCache[Product, bytes] = FormatCache(cache_size)
+        self._names: FormatCache[str, bytes] = FormatCache(cache_size)
+        self._descriptions: FormatCache[str, bytes] = FormatCache(cache_size)
+        self._amounts: FormatCache[Cents, bytes] = FormatCache(cache_size)
+
+    def render_into(self, receipt: Receipt, buffer: bytearray) -> None:
+        buffer += b'{"items":['
+        separator = b""
+        for item in receipt.iter_items():
+            buffer += separator
+            buffer += self._product(item)
+            buffer += b',"quantity":'
+            buffer += self._encode(item.quantity).encode()
+            buffer += b',"price":'
+            buffer += self._amount(item.price_cents)
+            buffer += b',"total":'
+            buffer += self._amount(item.total_cents)
+            buffer += b"}"
+            separator = b","
+
+        buffer += b'],"discounts":['
+        separator = b""
+        for discount in receipt.iter_discounts():
+            description = self._descriptions.get(discount.description)
+            if description is None:
+                description = self._descriptions.store(
+                    discount.description, self._encode(discount.description).encode()
+                )
+            buffer += separator
+            buffer += b'{"product":'
+            buffer += self._name(discount.product.name)
+            buffer += b',"description":'
+            buffer += description
+            buffer += b',"amount":'
+            buffer += self._amount(discount.discount_cents)
+            buffer += b"}"
+            separator = b","
+
+        buffer += b'],"total":'
+        buffer += self._amount(receipt.total_cents())
+        buffer += b"}"
+
+    def _product(self, item: ReceiptItem) -> bytes:
+        product = item.product
+        encoded = self._products.get(product)
+        if encoded is None:
+            encoded = self._products.store(
+                product,
+                b'{"product":'
+                + self._name(product.name)
+                + b',"unit":'
+                + self._encode(product.unit.name).encode(),
+            )
+        return encoded
+
+    def _name(self, name: str) -> bytes:
+        encoded = self._names.get(name)
+        if encoded is None:
+            encoded = self._names.store(name, self._encode(name).encode())
+        return encoded
+
+    def _amount(self, cents: Cents) -> bytes:
+        amount = self._amounts.get(cents)
+        if amount is None:
+            amount = self._amounts.store(cents, f'"{format_cents(cents)}"'.encode())
+        return amount
+
+
+RENDERERS: typing.Dict[str, typing.Callable[..., ReceiptRenderer]] = {
+    "text": TextRenderer,
+    "escpos": EscPosRenderer,
+    "json": JsonRenderer,
+}
+
+
+def register_renderer(
+    name: str, factory: typing.Callable[..., ReceiptRenderer]
+) -> None:
+    RENDERERS[name] = factory
+
+
+def renderer_for(name: str, **options: typing.Any) -> ReceiptRenderer:
+    return RENDERERS[name](**options)
@@ -0,0 +1,179 @@
+import argparse
+import csv
+import json
+import sys
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog import InMemoryCatalog
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+Basket = tuple[str, list[tuple[str, float]]]
+CatalogRow = tuple[str, str, float]
+ReplayResult = tuple[str, str, float]
+
+_teller: Teller | None = None
+_products: typing.Dict[str, Product] = {}
+_printer = ReceiptPrinter()
+
+
+def load_catalog(path: str) -> list[CatalogRow]:
+    with open(path, newline="") as file:
+        return [
+            (row["name"], row["unit"], float(row["price"]))
+            for row in csv.DictReader(file)
+        ]
+
+
+def load_offers(path: str | None) -> dict:
+    if path is None:
+        return {"offers": [], "bundles": []}
+    with open(path) as file:
+        offer_table = json.load(file)
+    offer_table.setdefault("offers", [])
+    offer_table.setdefault("bundles", [])
+    return offer_table
+
+
+def load_baskets(path: str) -> list[Basket]:
+    if path.endswith(".csv"):
+        baskets: typing.Dict[str, list[tuple[str, float]]] = {}
+        with open(path, newline="") as file:
+            for row in csv.DictReader(file):
+                baskets.setdefault(row["basket_id"], []).append(
+                    (row["product"], float(row["quantity"]))
+                )
+        return list(baskets.items())
+
+    with open(path) as file:
+        return [
+            (
+                str(basket["id"]),
+                [(name, quantity) for name, quantity in basket["items"]],
+            )
+            for basket in map(json.loads, filter(str.strip, file))
+        ]
+
+
+def build_teller(
+    catalog_rows: list[CatalogRow], offer_table: dict
+) -> tuple[Teller, typing.Dict[str, Product]]:
+    catalog = InMemoryCatalog()
+    products = {}
+    for name, unit, price in catalog_rows:
+        product = Product(name, ProductUnit[unit])
+        products[name] = product
+        catalog.add_product(product, price)
+
+    teller = Teller(catalog)
+    for offer in offer_table["offers"]:
+        teller.add_special_offer(
+            SpecialOfferType[offer["type"]],
+            products[offer["product"]],
+            offer.get("argument"),
+        )
+    for bundle in offer_table["bundles"]:
+        teller.add_bundle_offer(
+            SpecialOfferType[bundle["type"]],
+            [
+                ProductQuantity(products[name], quantity)
+                for name, quantity in bundle["products"].items()
+            ],
+            bundle.get("argument"),
+        )
+    return teller, products
+
+
+def _init_worker(catalog_rows: list[CatalogRow], offer_table: dict) -> None:
+    global _teller, _products
+    _teller, _products = build_teller(catalog_rows, offer_table)
+
+
+def _replay_chunk(chunk: list[Basket]) -> list[ReplayResult]:
+    receipts = []
+    for _, items in chunk:
+        cart = ShoppingCart()
+        for name, quantity in items:
+            cart.add_item_quantity(_products[name], quantity)
+        receipts.append(_teller.checks_out_articles_from(cart))
+    return [
+        (basket_id, printed, receipt.total_price())
+        for (basket_id, _), receipt, printed in zip(
+            chunk, receipts, _printer.print_receipts(receipts)
+        )
+    ]
+
+
+def replay(
+    baskets: list[Basket],
+    catalog_rows: list[CatalogRow],
+    offer_table: dict,
+    workers: int,
+    chunk_size: int = 256,
+) -> typing.Iterator[ReplayResult]:
+    chunks = []
+    for start in range(0, len(baskets), chunk_size):
+        end = start + chunk_size
+        chunks.append(baskets[start:end])
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(catalog_rows, offer_table),
+    ) as executor:
+        for results in executor.map(_replay_chunk, chunks):
+            yield from results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay baskets through the teller in parallel."
+    )
+    parser.add_argument("baskets", help="baskets as .jsonl or .csv")
+    parser.add_argument("--catalog", required=True, help="CSV with name,unit,price")
+    parser.add_argument("--offers", help="JSON file with offers and bundles")
+    parser.add_argument("--output", help="JSONL receipts output (default: stdout)")
+    parser.add_argument(
+        "--workers",
+        default="1",
+        help="worker count, or comma separated counts to compare throughput",
+    )
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    baskets = load_baskets(args.baskets)
+    catalog_rows = load_catalog(args.catalog)
+    offer_table = load_offers(args.offers)
+    worker_counts = [int(count) for count in args.workers.split(",")]
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for run, workers in enumerate(worker_counts):
+            start = time.perf_counter()
+            results = list(
+                replay(baskets, catalog_rows, offer_table, workers, args.chunk_size)
+            )
+            elapsed = time.perf_counter() - start
+            if run == 0:
+                output.writelines(
+                    json.dumps({"id": basket_id, "total": total, "receipt": printed})
+                    + "\n"
+                    for basket_id, printed, total in results
+                )
+            print(
+                f"workers={workers} baskets={len(baskets)} seconds={elapsed:.3f} "
+                f"baskets/s={len(baskets) / elapsed:.0f}",
+                file=sys.stderr,
+            )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import typing
+
+from bundle_allocation import allocate_bundles, connected_bundles
+from models.money import Cents, from_cents, round_half_up
+from models.offers import Bundle, CompiledOffer, Discount
+from models.products import Product
+from receipt import Receipt, ReceiptItem, ReceiptLineMode
+from shopping_cart import ShoppingCart
+
+if typing.TYPE_CHECKING:
+    from teller import Teller
+
+
+class RunningReceipt:
+    def __init__(self, teller: "Teller", cart: ShoppingCart | None = None) -> None:
+        self.teller = teller
+        self.cart = cart if cart is not None else ShoppingCart()
+        self._aggregated = teller.line_mode == ReceiptLineMode.AGGREGATED
+        self._items: list[ReceiptItem] = []
+        self._lines: typing.Dict[Product, ReceiptItem] = {}
+        self._offer_discounts: typing.Dict[Product, Discount] = {}
+        self._bundle_discounts: typing.Dict[Bundle, list[Discount]] = {}
+        self._total_cents = 0
+        self._prices: typing.Dict[Product, Cents] = teller.catalog.unit_prices_cents(
+            self.cart.scanned_products
+        )
+
+        if self._aggregated:
+            for product in self.cart.product_quantities:
+                self._set_line(product)
+        else:
+            for pq in self.cart.items:
+                self._add_line(pq.product, pq.quantity)
+        for product in self.cart.product_quantities:
+            self._update(product)
+        self.cart.add_listener(self._on_scan)
+
+    def total_cents(self) -> Cents:
+        return self._total_cents
+
+    def total_price(self) -> float:
+        return from_cents(self._total_cents)
+
+    def receipt(self) -> Receipt:
+        receipt = Receipt()
+        receipt.add_items(self._lines.values() if self._aggregated else self._items)
+        handled = set()
+        bundles = self.teller.offer_table.bundles
+        for product in self.cart.product_quantities:
+            for bundle in bundles.get(product, ()):
+                if bundle in self._bundle_discounts and bundle not in handled:
+                    handled.add(bundle)
+                    receipt.add_discounts(self._bundle_discounts[bundle])
+        for product in self.cart.product_quantities:
+            discount = self._offer_discounts.get(product)
+            if discount is not None:
+                receipt.add_discount(discount)
+        return receipt
+
+    def _on_scan(self, product: Product, quantity: float) -> None:
+        if product not in self._prices:
+            self._prices.update(self.teller.catalog.unit_prices_cents([product]))
+        if self._aggregated:
+            self._set_line(product)
+        else:
+            self._add_line(product, quantity)
+        self._update(product)
+
+    def _add_line(self, product: Product, quantity: float) -> None:
+        unit_price = self._prices[product]
+        total_price = quantity * unit_price
+        if total_price.__class__ is not int:
+            total_price = round_half_up(total_price)
+        self._items.append(ReceiptItem(product, quantity, unit_price, total_price))
+        self._total_cents += total_price
+
+    def _set_line(self, product: Product) -> None:
+        previous = self._lines.get(product)
+        if previous is not None:
+            self._total_cents -= previous.total_cents
+
+        quantity = self.cart.product_quantities.get(product)
+        if quantity is None:
+            self._lines.pop(product, None)
+            return
+        unit_price = self._prices[product]
+        total_price = quantity * unit_price
+        if total_price.__class__ is not int:
+            total_price = round_half_up(total_price)
+        self._lines[product] = ReceiptItem(product, quantity, unit_price, total_price)
+        self._total_cents += total_price
+
+    def _update(self, product: Product) -> None:
+        table = self.teller.offer_table
+        bundles = connected_bundles(product, table.bundles)
+        if not bundles:
+            self._update_offer(
+                table.compiled_offers,
+                product,
+                self.cart.product_quantities.get(product),
+            )
+            return
+
+        for bundle in bundles:
+            for discount in self._bundle_discounts.pop(bundle, ()):
+                self._total_cents -= discount.discount_cents
+        allocation = allocate_bundles(
+            bundles,
+            self.cart.product_quantities,
+            table.compiled_offers,
+            self._prices,
+        )
+        for bundle, applications in allocation.applications.items():
+            discounts = bundle.discounts(applications, self._prices)
+            self._bundle_discounts[bundle] = discounts
+            self._total_cents += sum(discount.discount_cents for discount in discounts)
+        for bundle_product in dict.fromkeys(
+            bundle_pq.product
+            for bundle in bundles
+            for bundle_pq in bundle.product_quantities
+        ):
+            quantity = self.cart.product_quantities.get(bundle_product)
+            self._update_offer(
+                table.compiled_offers,
+                bundle_product,
+                allocation.remaining.get(bundle_product, quantity),
+            )
+
+    def _update_offer(
+        self,
+        compiled_offers: typing.Dict[Product, CompiledOffer],
+        product: Product,
+        quantity: float | None,
+    ) -> None:
+        previous = self._offer_discounts.pop(product, None)
+        if previous is not None:
+            self._total_cents -= previous.discount_cents
+
+        offer = compiled_offers.get(product)
+        if offer is None or quantity is None or quantity <= 0:
+            return
+        discount = offer(quantity, self._prices)
+        if discount is not None:
+            self._offer_discounts[product] = discount
+            self._total_cents += discount.discount_cents
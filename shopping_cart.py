@@ -1,15 +1,20 @@
 import typing
 
-from catalog import SupermarketCatalog
-from models.offers import Bundle, Offer
+from bundle_allocation import BundleAllocation, allocate_bundles
+from models.money import Cents
+from models.offers import Bundle, CompiledOffer
 from models.products import Product, ProductQuantity
 from receipt import Receipt
 
+ScanListener = typing.Callable[[Product, float], None]
+
 
 class ShoppingCart:
     def __init__(self) -> None:
         self._items = []
         self._product_quantities = {}
+        self._scanned_products = {}
+        self._listeners: list[ScanListener] = []
 
     @property
     def items(self) -> list[ProductQuantity]:
@@ -22,33 +27,78 @@ class ShoppingCart:
     def product_quantities(self) -> typing.Dict[Product, float]:
         return self._product_quantities
 
+    @property
+    def scanned_products(self) -> typing.KeysView[Product]:
+        return self._scanned_products.keys()
+
     def add_item_quantity(self, product: Product, quantity: float) -> None:
         self._items.append(ProductQuantity(product, quantity))
+        self._scanned_products[product] = None
         if product in self._product_quantities.keys():
             self._product_quantities[product] = (
                 self._product_quantities[product] + quantity
             )
         else:
             self._product_quantities[product] = quantity
+        for listener in self._listeners:
+            listener(product, quantity)
+
+    def void_item_quantity(self, product: Product, quantity: float) -> None:
+        scanned = self._product_quantities.get(product, 0)
+        if quantity <= 0 or quantity > scanned:
+            raise ValueError(f"cannot void {quantity} of {product.name}")
+        self._items.append(ProductQuantity(product, -quantity))
+        if scanned - quantity > 0:
+            self._product_quantities[product] = scanned - quantity
+        else:
+            del self._product_quantities[product]
+        for listener in self._listeners:
+            listener(product, -quantity)
+
+    def add_listener(self, listener: ScanListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ScanListener) -> None:
+        self._listeners.remove(listener)
 
     def handle_offers(
         self,
         receipt: Receipt,
-        offers: typing.Dict[Product, Offer],
-        catalog: SupermarketCatalog,
+        offers: typing.Dict[Product, CompiledOffer],
+        prices: typing.Dict[Product, Cents],
+        remaining: typing.Dict[Product, float] | None = None,
     ) -> None:
-        for p in self._product_quantities.keys():
-            if p in offers.keys():
-                receipt.manage_offer(offers[p], self._product_quantities[p], catalog)
+        for p, quantity in self._product_quantities.items():
+            offer = offers.get(p)
+            if offer is not None:
+                if remaining is not None:
+                    quantity = remaining.get(p, quantity)
+                    if quantity <= 0:
+                        continue
+                discount = offer(quantity, prices)
+                if discount is not None:
+                    receipt.add_discount(discount)
+
+    def allocate_bundles(
+        self,
+        bundles: typing.Dict[Product, typing.Sequence[Bundle]],
+        offers: typing.Dict[Product, CompiledOffer],
+        prices: typing.Dict[Product, Cents],
+    ) -> BundleAllocation:
+        if not bundles:
+            return BundleAllocation()
+        return allocate_bundles(
+            (bundle for p in self._product_quantities for bundle in bundles.get(p, ())),
+            self._product_quantities,
+            offers,
+            prices,
+        )
 
     def handle_bundles(
         self,
         receipt: Receipt,
-        bundles: typing.Dict[Product, Bundle],
-        catalog: SupermarketCatalog,
+        allocation: BundleAllocation,
+        prices: typing.Dict[Product, Cents],
     ) -> None:
-        for p in self._product_quantities.keys():
-            if p in bundles.keys():
-                if p in [discount.product for discount in receipt.discounts]:
-                    continue
-                receipt.manage_bundle(bundles[p], self._product_quantities, catalog)
+        for bundle, applications in allocation.applications.items():
+            receipt.manage_bundle(bundle, applications, prices)
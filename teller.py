@@ -1,22 +1,79 @@
+import threading
+import types
 import typing
 
 from catalog import SupermarketCatalog
-from models.offers import Bundle, Offer, SpecialOfferType
+from instrumentation import (
+    CheckoutInstrumentation,
+    CheckoutTrace,
+    instrument_catalog,
+    uninstrument_catalog,
+)
+from models.money import Cents, round_half_up
+from models.offers import Bundle, CompiledOffer, Offer, SpecialOfferType
 from models.products import Product, ProductQuantity
-from receipt import Receipt
+from receipt import Receipt, ReceiptItem, ReceiptLineMode
+from running_receipt import RunningReceipt
 from shopping_cart import ShoppingCart
 
+if typing.TYPE_CHECKING:
+    from batch_checkout import BatchTotals
+
+
+class OfferTable:
+    __slots__ = ("version", "offers", "compiled_offers", "bundles")
+
+    def __init__(
+        self,
+        version: int,
+        offers: typing.Dict[Product, Offer],
+        compiled_offers: typing.Dict[Product, CompiledOffer],
+        bundles: typing.Dict[Product, tuple[Bundle, ...]],
+    ) -> None:
+        self.version = version
+        self.offers = offers
+        self.compiled_offers = compiled_offers
+        self.bundles = bundles
+
 
 class Teller:
-    def __init__(self, catalog: SupermarketCatalog) -> None:
+    def __init__(
+        self,
+        catalog: SupermarketCatalog,
+        line_mode: ReceiptLineMode = ReceiptLineMode.ITEMIZED,
+    ) -> None:
         self.catalog = catalog
-        self.offers: typing.Dict[Product, Offer] = {}
-        self.bundles: typing.Dict[Product, Bundle] = {}
+        self.line_mode = line_mode
+        self.offer_table = OfferTable(0, {}, {}, {})
+        self._offer_table_lock = threading.Lock()
+        self.instrumentation: CheckoutInstrumentation | None = None
+
+    @property
+    def offers(self) -> typing.Mapping[Product, Offer]:
+        return types.MappingProxyType(self.offer_table.offers)
+
+    @property
+    def compiled_offers(self) -> typing.Mapping[Product, CompiledOffer]:
+        return types.MappingProxyType(self.offer_table.compiled_offers)
+
+    @property
+    def bundles(self) -> typing.Mapping[Product, tuple[Bundle, ...]]:
+        return types.MappingProxyType(self.offer_table.bundles)
 
     def add_special_offer(
         self, offer_type: SpecialOfferType, product: Product, argument: float | None
     ) -> None:
-        self.offers[product] = Offer(offer_type, product, argument)
+        offer = Offer(offer_type, product, argument)
+        compiled_offer = offer.compile()
+        with self._offer_table_lock:
+            table = self.offer_table
+            offers = dict(table.offers)
+            offers[product] = offer
+            compiled_offers = dict(table.compiled_offers)
+            compiled_offers[product] = compiled_offer
+            self.offer_table = OfferTable(
+                table.version + 1, offers, compiled_offers, table.bundles
+            )
 
     def add_bundle_offer(
         self,
@@ -24,22 +81,98 @@ class Teller:
         product_quantities: list[ProductQuantity],
         argument: float | None,
     ) -> None:
-        for product_quantity in product_quantities:
-            self.bundles[product_quantity.product] = Bundle(
-                offer_type, product_quantities, argument
+        bundle = Bundle(offer_type, product_quantities, argument)
+        with self._offer_table_lock:
+            table = self.offer_table
+            bundles = dict(table.bundles)
+            for product_quantity in product_quantities:
+                product = product_quantity.product
+                bundles[product] = bundles.get(product, ()) + (bundle,)
+            self.offer_table = OfferTable(
+                table.version + 1, table.offers, table.compiled_offers, bundles
             )
 
+    def enable_instrumentation(
+        self, instrumentation: CheckoutInstrumentation | None = None
+    ) -> CheckoutInstrumentation:
+        if instrumentation is None:
+            instrumentation = CheckoutInstrumentation()
+        self.disable_instrumentation()
+        self.instrumentation = instrumentation
+        self.catalog = instrument_catalog(self.catalog, instrumentation)
+        return instrumentation
+
+    def disable_instrumentation(self) -> None:
+        self.instrumentation = None
+        self.catalog = uninstrument_catalog(self.catalog)
+
     def checks_out_articles_from(self, the_cart: ShoppingCart) -> Receipt:
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            prices = self.catalog.unit_prices_cents(the_cart.scanned_products)
+            return self.checks_out_with_prices(the_cart, prices)
+
+        trace = instrumentation.start()
+        prices = self.catalog.unit_prices_cents(the_cart.scanned_products)
+        trace.mark("prices")
+        receipt = self.checks_out_with_prices(the_cart, prices, trace)
+        instrumentation.finish(trace, receipt, len(prices))
+        return receipt
+
+    def checks_out_with_prices(
+        self,
+        the_cart: ShoppingCart,
+        prices: typing.Dict[Product, Cents],
+        trace: CheckoutTrace | None = None,
+    ) -> Receipt:
         receipt = Receipt()
-        product_quantities = the_cart.items
-        for pq in product_quantities:
-            p = pq.product
-            quantity = pq.quantity
-            unit_price = self.catalog.unit_price(p)
-            price = quantity * unit_price
-            receipt.add_product(p, quantity, unit_price, price)
+        items = []
+        if self.line_mode == ReceiptLineMode.AGGREGATED:
+            for product, quantity in the_cart.product_quantities.items():
+                unit_price = prices[product]
+                total_price = quantity * unit_price
+                if total_price.__class__ is not int:
+                    total_price = round_half_up(total_price)
+                items.append(ReceiptItem(product, quantity, unit_price, total_price))
+        else:
+            for pq in the_cart.items:
+                unit_price = prices[pq.product]
+                total_price = pq.quantity * unit_price
+                if total_price.__class__ is not int:
+                    total_price = round_half_up(total_price)
+                items.append(
+                    ReceiptItem(pq.product, pq.quantity, unit_price, total_price)
+                )
+        receipt.add_items(items)
+        if trace is not None:
+            trace.mark("lines")
 
-        the_cart.handle_bundles(receipt, self.bundles, self.catalog)
-        the_cart.handle_offers(receipt, self.offers, self.catalog)
+        table = self.offer_table
+        allocation = the_cart.allocate_bundles(
+            table.bundles, table.compiled_offers, prices
+        )
+        the_cart.handle_bundles(receipt, allocation, prices)
+        if trace is not None:
+            trace.mark("bundles")
+        the_cart.handle_offers(
+            receipt, table.compiled_offers, prices, allocation.remaining
+        )
+        if trace is not None:
+            trace.mark("offers")
 
         return receipt
+
+    def checks_out_many(self, carts: typing.Iterable[ShoppingCart]) -> list[Receipt]:
+        from batch_checkout import checks_out_many
+
+        return checks_out_many(self, carts)
+
+    def checks_out_totals(self, carts: typing.Iterable[ShoppingCart]) -> "BatchTotals":
+        from batch_checkout import checks_out_totals
+
+        return checks_out_totals(self, carts)
+
+    def open_running_receipt(
+        self, the_cart: ShoppingCart | None = None
+    ) -> RunningReceipt:
+        return RunningReceipt(self, the_cart)
@@ -8,10 +8,18 @@ class FakeCatalog(SupermarketCatalog):
     def __init__(self):
         self.products = {}
         self.prices = {}
+        self.lookups = 0
 
     def add_product(self, product: Product, price: float):
         self.products[product.name] = product
         self.prices[product.name] = price
 
     def unit_price(self, product: Product) -> typing.Dict[str, float]:
+        self.lookups += 1
         return self.prices[product.name]
+
+    def unit_prices(
+        self, products: typing.Iterable[Product]
+    ) -> typing.Dict[Product, float]:
+        self.lookups += 1
+        return {product: self.prices[product.name] for product in products}
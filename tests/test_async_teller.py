@@ -0,0 +1,145 @@
+import asyncio
+import unittest
+
+from async_teller import AsyncTeller
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class FakeAsyncCatalog:
+    def __init__(self, catalog: FakeCatalog) -> None:
+        self.catalog = catalog
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested: list[Product] = []
+
+    async def unit_price(self, product: Product) -> float:
+        self.requested.append(product)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return self.catalog.unit_price(product)
+
+
+class AsyncTellerTestCase(unittest.IsolatedAsyncioTestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.catalog.add_product(product=self.apples, price=self.apples_price)
+        self.catalog.add_product(product=self.rice, price=self.rice_price)
+        self.catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.async_catalog = FakeAsyncCatalog(self.catalog)
+
+        self.shopping_cart = ShoppingCart()
+        self.shopping_cart.add_item_quantity(self.toothbrush, 3)
+        self.shopping_cart.add_item_quantity(self.apples, 1.5)
+        self.shopping_cart.add_item(self.rice)
+        self.shopping_cart.add_item_quantity(self.toothpaste, 2)
+        self.shopping_cart.add_item(self.rice)
+
+    def configure(self, teller: Teller | AsyncTeller) -> None:
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.apples, 20)
+        teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+
+    async def test_matches_synchronous_checkout(self):
+        teller = Teller(self.catalog)
+        async_teller = AsyncTeller(self.async_catalog)
+        self.configure(teller)
+        self.configure(async_teller)
+
+        receipt = await async_teller.checks_out_articles_from(self.shopping_cart)
+
+        printer = ReceiptPrinter()
+        self.assertEqual(
+            printer.print_receipt(receipt),
+            printer.print_receipt(teller.checks_out_articles_from(self.shopping_cart)),
+        )
+
+    async def test_each_product_is_fetched_once(self):
+        async_teller = AsyncTeller(self.async_catalog)
+
+        await async_teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertCountEqual(
+            self.async_catalog.requested,
+            [self.toothbrush, self.apples, self.rice, self.toothpaste],
+        )
+
+    async def test_concurrency_is_limited(self):
+        async_teller = AsyncTeller(self.async_catalog, max_concurrency=2)
+
+        await async_teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(self.async_catalog.max_in_flight, 2)
+
+    async def test_concurrent_checkouts(self):
+        async_teller = AsyncTeller(self.async_catalog)
+        self.configure(async_teller)
+
+        receipts = await asyncio.gather(
+            *(
+                async_teller.checks_out_articles_from(self.shopping_cart)
+                for _ in range(10)
+            )
+        )
+
+        self.assertEqual(len({receipt.total_cents() for receipt in receipts}), 1)
+
+    async def test_concurrency_is_limited_across_checkouts(self):
+        async_teller = AsyncTeller(self.async_catalog, max_concurrency=3)
+
+        await asyncio.gather(
+            *(
+                async_teller.checks_out_articles_from(self.shopping_cart)
+                for _ in range(10)
+            )
+        )
+
+        self.assertEqual(len(self.async_catalog.requested), 40)
+        self.assertEqual(self.async_catalog.max_in_flight, 3)
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncTeller(self.async_catalog, max_concurrency=0)
+
+    def test_exposes_no_synchronous_checkout_paths(self):
+        async_teller = AsyncTeller(self.async_catalog)
+        self.configure(async_teller)
+
+        self.assertFalse(hasattr(async_teller, "checks_out_many"))
+        self.assertFalse(hasattr(async_teller, "open_running_receipt"))
+        self.assertEqual(len(async_teller.offers), 2)
+        self.assertEqual(len(async_teller.bundles[self.rice]), 1)
+
+    async def test_instrumentation_counts_each_price_request(self):
+        async_teller = AsyncTeller(self.async_catalog)
+        instrumentation = async_teller.enable_instrumentation()
+
+        await async_teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(instrumentation.checkouts, 1)
+        self.assertEqual(
+            instrumentation.catalog_calls, len(self.async_catalog.requested)
+        )
@@ -0,0 +1,199 @@
+import random
+import unittest
+from unittest import mock
+
+from batch_checkout import VECTOR_OFFERS
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt import Receipt, ReceiptLineMode
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class BatchCheckoutTestCase(unittest.TestCase):
+    catalog: FakeCatalog | None = None
+    teller: Teller | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    cherry_tomatoes = Product("cherry_tomatoes", ProductUnit.EACH)
+    cherry_tomatoes_price = 0.69
+
+    milk = Product("milk", ProductUnit.EACH)
+    milk_price = 1.19
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.catalog = FakeCatalog()
+
+        cls.catalog.add_product(product=cls.toothbrush, price=cls.toothbrush_price)
+        cls.catalog.add_product(product=cls.apples, price=cls.apples_price)
+        cls.catalog.add_product(product=cls.rice, price=cls.rice_price)
+        cls.catalog.add_product(product=cls.toothpaste, price=cls.toothpaste_price)
+        cls.catalog.add_product(
+            product=cls.cherry_tomatoes, price=cls.cherry_tomatoes_price
+        )
+        cls.catalog.add_product(product=cls.milk, price=cls.milk_price)
+
+    def setUp(self) -> None:
+        self.teller = Teller(self.catalog)
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_special_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT, self.apples, 20
+        )
+        self.teller.add_special_offer(
+            SpecialOfferType.FIVE_FOR_AMOUNT, self.toothpaste, 7.49
+        )
+        self.teller.add_special_offer(
+            SpecialOfferType.TWO_FOR_AMOUNT, self.cherry_tomatoes, 0.99
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.milk, 2)],
+            10,
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothpaste, 2), ProductQuantity(self.milk, 1)],
+            15,
+        )
+
+    def random_carts(self, count: int) -> list[ShoppingCart]:
+        generator = random.Random(42)
+        products = [
+            self.toothbrush,
+            self.apples,
+            self.rice,
+            self.toothpaste,
+            self.cherry_tomatoes,
+            self.milk,
+        ]
+        carts = []
+        for _ in range(count):
+            cart = ShoppingCart()
+            for _ in range(generator.randint(0, 12)):
+                product = generator.choice(products)
+                if product.unit == ProductUnit.KILO:
+                    cart.add_item_quantity(product, generator.uniform(0.1, 3.0))
+                else:
+                    cart.add_item_quantity(product, generator.randint(1, 6))
+                if generator.random() < 0.05:
+                    cart.void_item_quantity(product, cart.product_quantities[product])
+            carts.append(cart)
+        return carts
+
+    def assertReceiptsEqual(self, actual: Receipt, expected: Receipt) -> None:
+        self.assertEqual(
+            [
+                (item.product, item.quantity, item.price, item.total_price)
+                for item in actual.items
+            ],
+            [
+                (item.product, item.quantity, item.price, item.total_price)
+                for item in expected.items
+            ],
+        )
+        self.assertEqual(
+            [
+                (discount.product, discount.description, discount.discount_amount)
+                for discount in actual.discounts
+            ],
+            [
+                (discount.product, discount.description, discount.discount_amount)
+                for discount in expected.discounts
+            ],
+        )
+        self.assertEqual(actual.total_price(), expected.total_price())
+
+    def test_matches_scalar_checkout(self):
+        carts = self.random_carts(200)
+
+        receipts = self.teller.checks_out_many(carts)
+
+        self.assertEqual(len(receipts), len(carts))
+        for cart, receipt in zip(carts, receipts):
+            self.assertReceiptsEqual(
+                receipt, self.teller.checks_out_articles_from(cart)
+            )
+
+    def test_matches_scalar_checkout_without_bundles(self):
+        teller = Teller(self.catalog)
+        for product, offer in self.teller.offers.items():
+            teller.add_special_offer(offer.offer_type, product, offer.argument)
+        carts = self.random_carts(200)
+
+        receipts = teller.checks_out_many(carts)
+
+        for cart, receipt in zip(carts, receipts):
+            self.assertReceiptsEqual(receipt, teller.checks_out_articles_from(cart))
+
+    def test_aggregated_lines_match_scalar_checkout(self):
+        self.teller.line_mode = ReceiptLineMode.AGGREGATED
+        carts = self.random_carts(50)
+
+        receipts = self.teller.checks_out_many(carts)
+
+        for cart, receipt in zip(carts, receipts):
+            self.assertReceiptsEqual(
+                receipt, self.teller.checks_out_articles_from(cart)
+            )
+
+    def test_offers_without_vector_kernel_match_scalar_checkout(self):
+        carts = self.random_carts(100)
+
+        with mock.patch.dict(VECTOR_OFFERS):
+            del VECTOR_OFFERS[SpecialOfferType.TEN_PERCENT_DISCOUNT]
+            receipts = self.teller.checks_out_many(carts)
+
+        for cart, receipt in zip(carts, receipts):
+            self.assertReceiptsEqual(
+                receipt, self.teller.checks_out_articles_from(cart)
+            )
+
+    def test_totals_match_receipts(self):
+        carts = self.random_carts(200)
+
+        totals = self.teller.checks_out_totals(carts)
+
+        receipts = [self.teller.checks_out_articles_from(cart) for cart in carts]
+        self.assertEqual(len(totals), len(carts))
+        self.assertEqual(
+            totals.total_cents.tolist(),
+            [receipt.total_cents() for receipt in receipts],
+        )
+        self.assertEqual(
+            totals.discount_cents.tolist(),
+            [
+                sum(discount.discount_cents for discount in receipt.discounts)
+                for receipt in receipts
+            ],
+        )
+
+    def test_empty_batch(self):
+        self.assertEqual(self.teller.checks_out_many([]), [])
+        self.assertEqual(len(self.teller.checks_out_totals([])), 0)
+
+    def test_single_catalog_lookup(self):
+        catalog = FakeCatalog()
+        catalog.add_product(product=self.rice, price=self.rice_price)
+        teller = Teller(catalog)
+        carts = [ShoppingCart() for _ in range(10)]
+        for cart in carts:
+            cart.add_item(self.rice)
+
+        teller.checks_out_many(carts)
+
+        self.assertEqual(catalog.lookups, 1)
@@ -0,0 +1,42 @@
+import json
+import unittest
+
+from benchmarks import suite
+
+
+class BenchmarkSuiteTestCase(unittest.TestCase):
+    def test_compare_flags_slowdowns_past_threshold(self):
+        baseline = {"checkout/small/none": 10.0, "print/small/none": 10.0}
+        results = {
+            "checkout/small/none": 12.0,
+            "print/small/none": 13.0,
+            "scan/small/none": 50.0,
+        }
+
+        self.assertEqual(
+            suite.compare(results, baseline, threshold=0.25),
+            [("print/small/none", 10.0, 13.0)],
+        )
+
+    def test_run_selected_benchmarks(self):
+        results = suite.run(repeat=1, selected="small/sparse")
+
+        self.assertEqual(
+            sorted(results),
+            [f"{name}/small/sparse" for name in sorted(suite.BENCHMARKS)],
+        )
+        self.assertTrue(all(microseconds > 0 for microseconds in results.values()))
+
+    def test_baseline_covers_every_benchmark(self):
+        with open(suite.BASELINE) as file:
+            baseline = json.load(file)
+
+        self.assertEqual(
+            set(baseline),
+            {
+                f"{name}/{size}/{density}"
+                for name in suite.BENCHMARKS
+                for size in suite.SIZES
+                for density in suite.DENSITIES
+            },
+        )
@@ -0,0 +1,173 @@
+import time
+import unittest
+
+from bundle_allocation import allocate_bundles
+from models.offers import Bundle, SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class BundleAllocationTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.catalog.add_product(product=self.rice, price=self.rice_price)
+        self.teller = Teller(self.catalog)
+        self.shopping_cart = ShoppingCart()
+
+    def test_product_in_several_bundles(self):
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothpaste, 1), ProductQuantity(self.rice, 1)],
+            20,
+        )
+        self.assertEqual(len(self.teller.bundles[self.toothpaste]), 2)
+
+        self.shopping_cart.add_item(self.toothbrush)
+        self.shopping_cart.add_item(self.toothpaste)
+        self.shopping_cart.add_item(self.rice)
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(
+            [
+                (discount.product, discount.description, discount.discount_amount)
+                for discount in receipt.discounts
+            ],
+            [(self.toothpaste, "20% off", -0.36), (self.rice, "20% off", -0.5)],
+        )
+
+    def test_single_offer_wins_over_bundle(self):
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+
+        self.shopping_cart.add_item_quantity(self.toothbrush, 3)
+        self.shopping_cart.add_item(self.toothpaste)
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(len(receipt.discounts), 1)
+        self.assertEqual(receipt.discounts[0].description, "3 for 2")
+        self.assertAlmostEqual(receipt.total_price(), 2 * 0.99 + 1.79)
+
+    def test_offer_applies_to_quantity_left_by_bundles(self):
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+
+        self.shopping_cart.add_item_quantity(self.toothbrush, 4)
+        self.shopping_cart.add_item(self.toothpaste)
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(
+            [discount.discount_amount for discount in receipt.discounts],
+            [-0.1, -0.18, -0.99],
+        )
+
+    def test_offer_that_raises_the_price_does_not_break_allocation(self):
+        self.teller.add_special_offer(
+            SpecialOfferType.TWO_FOR_AMOUNT, self.toothbrush, 2.5
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+
+        self.shopping_cart.add_item_quantity(self.toothbrush, 2)
+        self.shopping_cart.add_item(self.toothpaste)
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(
+            [discount.discount_amount for discount in receipt.discounts],
+            [-0.1, -0.18],
+        )
+        self.assertAlmostEqual(receipt.total_price(), 2 * 0.99 + 1.79 - 0.28)
+
+    def test_offer_that_raises_the_price_does_not_prune_the_best_allocation(self):
+        self.teller.add_special_offer(
+            SpecialOfferType.FIVE_FOR_AMOUNT, self.toothbrush, 5.0
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 3)],
+            30,
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1)],
+            30,
+        )
+
+        self.shopping_cart.add_item_quantity(self.toothbrush, 5)
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(receipt.total_cents(), 5 * 99 - 149)
+
+    def test_step_limit_still_returns_feasible_allocation(self):
+        bundles = [
+            Bundle(
+                SpecialOfferType.TEN_PERCENT_DISCOUNT,
+                [ProductQuantity(self.toothbrush, 1), ProductQuantity(product, 1)],
+                argument,
+            )
+            for product, argument in [(self.toothpaste, 10), (self.rice, 20)]
+        ]
+        quantities = {self.toothbrush: 1, self.toothpaste: 1, self.rice: 1}
+        prices = {self.toothbrush: 99, self.toothpaste: 179, self.rice: 249}
+
+        allocation = allocate_bundles(bundles, quantities, {}, prices, step_limit=1)
+
+        self.assertEqual(sum(allocation.applications.values()), 1)
+        self.assertEqual(allocation.remaining[self.toothbrush], 0)
+
+    def test_hundreds_of_overlapping_bundles(self):
+        products = [Product(f"item-{index}", ProductUnit.EACH) for index in range(400)]
+        for product in products:
+            self.catalog.add_product(product, 1.0)
+            self.teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, product, None)
+            self.shopping_cart.add_item_quantity(product, 4)
+        for first, second in zip(products, products[1:]):
+            self.teller.add_bundle_offer(
+                SpecialOfferType.TEN_PERCENT_DISCOUNT,
+                [ProductQuantity(first, 2), ProductQuantity(second, 1)],
+                10,
+            )
+
+        start = time.perf_counter()
+        allocation = self.shopping_cart.allocate_bundles(
+            self.teller.bundles,
+            self.teller.compiled_offers,
+            self.catalog.unit_prices_cents(products),
+        )
+
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertTrue(
+            all(quantity >= 0 for quantity in allocation.remaining.values())
+        )
@@ -0,0 +1,111 @@
+import unittest
+
+from caching_catalog import CachingCatalog
+from models.products import Product, ProductUnit
+from tests.fake_catalog import FakeCatalog
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CachingCatalogTestCase(unittest.TestCase):
+    catalog: FakeCatalog | None = None
+    clock: FakeClock | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.catalog.add_product(product=self.apples, price=self.apples_price)
+        self.catalog.add_product(product=self.rice, price=self.rice_price)
+        self.clock = FakeClock()
+
+    def test_unit_price_is_cached(self):
+        caching_catalog = CachingCatalog(self.catalog)
+
+        self.assertEqual(caching_catalog.unit_price(self.apples), self.apples_price)
+        self.assertEqual(caching_catalog.unit_price(self.apples), self.apples_price)
+
+        self.assertEqual(self.catalog.lookups, 1)
+        self.assertEqual(caching_catalog.hits, 1)
+        self.assertEqual(caching_catalog.misses, 1)
+
+    def test_unit_prices_fetches_only_missing_products(self):
+        caching_catalog = CachingCatalog(self.catalog)
+        caching_catalog.unit_price(self.apples)
+
+        prices = caching_catalog.unit_prices([self.apples, self.rice, self.toothbrush])
+
+        self.assertEqual(
+            prices,
+            {
+                self.apples: self.apples_price,
+                self.rice: self.rice_price,
+                self.toothbrush: self.toothbrush_price,
+            },
+        )
+        self.assertEqual(self.catalog.lookups, 2)
+        self.assertEqual(caching_catalog.hits, 1)
+        self.assertEqual(caching_catalog.misses, 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        caching_catalog = CachingCatalog(self.catalog, max_size=2)
+        caching_catalog.unit_price(self.apples)
+        caching_catalog.unit_price(self.rice)
+        caching_catalog.unit_price(self.apples)
+        caching_catalog.unit_price(self.toothbrush)
+
+        self.assertEqual(len(caching_catalog), 2)
+        self.assertEqual(caching_catalog.evictions, 1)
+
+        caching_catalog.unit_price(self.apples)
+        self.assertEqual(self.catalog.lookups, 3)
+        caching_catalog.unit_price(self.rice)
+        self.assertEqual(self.catalog.lookups, 4)
+
+    def test_entry_expires_after_ttl(self):
+        caching_catalog = CachingCatalog(self.catalog, ttl=10, clock=self.clock)
+        caching_catalog.unit_price(self.apples)
+
+        self.clock.now = 9.5
+        caching_catalog.unit_price(self.apples)
+        self.assertEqual(self.catalog.lookups, 1)
+
+        self.clock.now = 10
+        caching_catalog.unit_price(self.apples)
+        self.assertEqual(self.catalog.lookups, 2)
+
+    def test_add_product_invalidates_price(self):
+        caching_catalog = CachingCatalog(self.catalog)
+        caching_catalog.unit_price(self.apples)
+
+        caching_catalog.add_product(self.apples, 2.49)
+
+        self.assertEqual(caching_catalog.unit_price(self.apples), 2.49)
+
+    def test_invalidate_all(self):
+        caching_catalog = CachingCatalog(self.catalog)
+        caching_catalog.unit_prices([self.apples, self.rice])
+
+        caching_catalog.invalidate_all()
+
+        self.assertEqual(len(caching_catalog), 0)
+        caching_catalog.unit_price(self.rice)
+        self.assertEqual(self.catalog.lookups, 2)
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            CachingCatalog(self.catalog, max_size=0)
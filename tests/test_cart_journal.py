@@ -0,0 +1,157 @@
+import os
+import random
+import tempfile
+import unittest
+
+from cart_journal import HEADER, CartJournal, read_cart, resume_journal
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class CartJournalTestCase(unittest.TestCase):
+    directory: tempfile.TemporaryDirectory | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.directory.name, "till-1.journal")
+        catalog = FakeCatalog()
+        catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        catalog.add_product(product=self.apples, price=self.apples_price)
+        catalog.add_product(product=self.rice, price=self.rice_price)
+        catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.teller = Teller(catalog)
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 2)],
+            10,
+        )
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def scan_randomly(self, cart: ShoppingCart, scans: int, seed: int = 4) -> None:
+        generator = random.Random(seed)
+        products = [self.toothbrush, self.apples, self.rice, self.toothpaste]
+        for _ in range(scans):
+            product = generator.choice(products)
+            scanned = cart.product_quantities.get(product, 0)
+            if scanned and generator.random() < 0.2:
+                cart.void_item_quantity(product, scanned)
+            elif product.unit == ProductUnit.KILO:
+                cart.add_item_quantity(product, generator.uniform(0.1, 3.0))
+            elif generator.random() < 0.5:
+                cart.add_item(product)
+            else:
+                cart.add_item_quantity(product, generator.randint(1, 6))
+
+    def assertSameCart(self, restored: ShoppingCart, cart: ShoppingCart) -> None:
+        self.assertEqual(
+            [(pq.product, pq.quantity, type(pq.quantity)) for pq in restored.items],
+            [(pq.product, pq.quantity, type(pq.quantity)) for pq in cart.items],
+        )
+        self.assertEqual(restored.product_quantities, cart.product_quantities)
+        self.assertEqual(list(restored.scanned_products), list(cart.scanned_products))
+
+    def test_replay_rebuilds_cart(self):
+        cart = ShoppingCart()
+        with CartJournal(self.journal_path, cart, sync=False):
+            self.scan_randomly(cart, 200)
+
+        self.assertSameCart(read_cart(self.journal_path), cart)
+
+    def test_journal_starts_from_existing_cart(self):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.toothbrush, 3)
+        with CartJournal(self.journal_path, cart) as journal:
+            cart.add_item(self.rice)
+            self.assertEqual(journal.scans, 1)
+
+        self.assertSameCart(read_cart(self.journal_path), cart)
+
+    def test_compaction_keeps_cart_and_bounds_appended_scans(self):
+        cart = ShoppingCart()
+        with CartJournal(self.journal_path, cart, False, compact_every=16) as journal:
+            self.scan_randomly(cart, 100)
+            self.assertLess(journal.scans, 16)
+
+        self.assertSameCart(read_cart(self.journal_path), cart)
+
+    def test_torn_final_record_is_dropped(self):
+        cart = ShoppingCart()
+        with CartJournal(self.journal_path, cart, sync=False):
+            cart.add_item_quantity(self.toothbrush, 2)
+            before = os.path.getsize(self.journal_path)
+            cart.add_item(self.apples)
+        with open(self.journal_path, "r+b") as file:
+            file.truncate(before + 3)
+
+        restored = read_cart(self.journal_path)
+
+        self.assertEqual(restored.product_quantities, {self.toothbrush: 2})
+
+    def test_resume_on_another_till_continues_receipt(self):
+        cart = ShoppingCart()
+        journal = CartJournal(self.journal_path, cart, sync=False)
+        self.scan_randomly(cart, 50)
+        journal.close()
+
+        resumed = resume_journal(self.journal_path, sync=False)
+        running = self.teller.open_running_receipt(resumed.cart)
+        resumed.cart.add_item_quantity(self.toothpaste, 2)
+        cart.add_item_quantity(self.toothpaste, 2)
+        resumed.close()
+
+        printer = ReceiptPrinter()
+        self.assertEqual(
+            printer.print_receipt(running.receipt()),
+            printer.print_receipt(self.teller.checks_out_articles_from(cart)),
+        )
+        self.assertSameCart(read_cart(self.journal_path), cart)
+
+    def test_closed_journal_stops_recording(self):
+        cart = ShoppingCart()
+        journal = CartJournal(self.journal_path, cart, sync=False)
+        cart.add_item(self.rice)
+        journal.close()
+        cart.add_item(self.rice)
+
+        self.assertEqual(read_cart(self.journal_path).product_quantities[self.rice], 1)
+
+        journal.discard()
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_rejects_foreign_file(self):
+        with open(self.journal_path, "wb") as file:
+            file.write(b"not a journal at all")
+
+        with self.assertRaises(ValueError):
+            read_cart(self.journal_path)
+
+    def test_scan_record_is_compact(self):
+        cart = ShoppingCart()
+        with CartJournal(self.journal_path, cart, sync=False):
+            cart.add_item(self.toothbrush)
+            before = os.path.getsize(self.journal_path)
+            cart.add_item(self.toothbrush)
+
+        self.assertEqual(os.path.getsize(self.journal_path) - before, 14)
+        self.assertGreater(before, HEADER.size)
@@ -0,0 +1,154 @@
+import unittest
+
+from caching_catalog import CachingCatalog
+from catalog import SupermarketCatalog
+from instrumentation import PHASES, CheckoutInstrumentation, CheckoutTrace
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class TickingClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+class PerProductCatalog(SupermarketCatalog):
+    def __init__(self, catalog: FakeCatalog) -> None:
+        self.catalog = catalog
+
+    def unit_price(self, product: Product) -> float:
+        return self.catalog.unit_price(product)
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.catalog.add_product(product=self.rice, price=self.rice_price)
+        self.catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.teller = Teller(self.catalog)
+        self.configure(self.teller)
+        self.shopping_cart = ShoppingCart()
+        self.shopping_cart.add_item_quantity(self.toothbrush, 3)
+        self.shopping_cart.add_item(self.rice)
+        self.shopping_cart.add_item(self.toothpaste)
+        self.shopping_cart.add_item(self.rice)
+
+    def configure(self, teller: Teller) -> None:
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+        teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.teller.instrumentation)
+        self.teller.checks_out_articles_from(self.shopping_cart)
+
+    def test_records_phase_timings_and_counts(self):
+        instrumentation = self.teller.enable_instrumentation(
+            CheckoutInstrumentation(clock=TickingClock())
+        )
+
+        self.teller.checks_out_articles_from(self.shopping_cart)
+        self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(instrumentation.checkouts, 2)
+        self.assertEqual(instrumentation.lines, 8)
+        self.assertEqual(instrumentation.discounts, 6)
+        self.assertEqual(instrumentation.catalog_calls, self.catalog.lookups)
+        self.assertEqual(instrumentation.catalog_calls, 2)
+        self.assertEqual(instrumentation.priced_products, 6)
+        self.assertEqual(instrumentation.phase_seconds, dict.fromkeys(PHASES, 2.0))
+
+    def test_hooks_receive_each_checkout(self):
+        instrumentation = self.teller.enable_instrumentation(
+            CheckoutInstrumentation(clock=TickingClock())
+        )
+        traces: list[CheckoutTrace] = []
+        instrumentation.add_hook(traces.append)
+
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(traces[0].lines, len(receipt.items))
+        self.assertEqual(traces[0].discounts, len(receipt.discounts))
+        self.assertEqual(list(traces[0].phase_seconds), list(PHASES))
+        self.assertEqual(traces[0].seconds, 4.0)
+
+    def test_disable_and_reset(self):
+        instrumentation = self.teller.enable_instrumentation()
+        self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.teller.disable_instrumentation()
+        self.teller.checks_out_articles_from(self.shopping_cart)
+        self.assertEqual(instrumentation.checkouts, 1)
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.checkouts, 0)
+        self.assertEqual(instrumentation.phase_seconds, dict.fromkeys(PHASES, 0.0))
+        self.assertIs(self.teller.catalog, self.catalog)
+
+    def test_counts_per_product_fallback_lookups(self):
+        teller = Teller(PerProductCatalog(self.catalog))
+        instrumentation = teller.enable_instrumentation()
+
+        teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(instrumentation.catalog_calls, 3)
+        self.assertEqual(instrumentation.catalog_calls, self.catalog.lookups)
+
+    def test_cache_hits_are_not_catalog_calls(self):
+        caching_catalog = CachingCatalog(self.catalog)
+        teller = Teller(caching_catalog)
+        instrumentation = teller.enable_instrumentation()
+
+        teller.checks_out_articles_from(self.shopping_cart)
+        teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(instrumentation.catalog_calls, 1)
+        self.assertEqual(instrumentation.catalog_calls, self.catalog.lookups)
+        teller.disable_instrumentation()
+        self.assertIs(caching_catalog.catalog, self.catalog)
+
+    def test_tellers_sharing_a_cache_count_their_own_calls(self):
+        caching_catalog = CachingCatalog(self.catalog)
+        first = Teller(caching_catalog)
+        second = Teller(caching_catalog)
+        first_instrumentation = first.enable_instrumentation()
+        second_instrumentation = second.enable_instrumentation()
+
+        first.checks_out_articles_from(self.shopping_cart)
+        second.checks_out_articles_from(self.shopping_cart)
+        cart = ShoppingCart()
+        cart.add_item(Product("toothbrush", ProductUnit.EACH))
+        caching_catalog.invalidate(self.toothbrush)
+        second.checks_out_articles_from(cart)
+
+        self.assertEqual(first_instrumentation.catalog_calls, 1)
+        self.assertEqual(second_instrumentation.catalog_calls, 1)
+        self.assertEqual(self.catalog.lookups, 2)
+
+        first.disable_instrumentation()
+        caching_catalog.invalidate(self.toothbrush)
+        second.checks_out_articles_from(cart)
+        self.assertEqual(second_instrumentation.catalog_calls, 2)
+        self.assertIs(first.catalog, caching_catalog)
+        self.assertIs(caching_catalog.catalog, self.catalog)
@@ -0,0 +1,122 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+import mapped_catalog
+from mapped_catalog import MappedCatalog, build_mapped_catalog, write_mapped_catalog
+from models.offers import SpecialOfferType
+from models.products import Product, ProductUnit
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class MappedCatalogTestCase(unittest.TestCase):
+    directory: tempfile.TemporaryDirectory | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_path = self.path("prices.csv")
+        with open(self.csv_path, "w") as file:
+            file.write("name,unit,price\n")
+            file.write(f"toothbrush,EACH,{self.toothbrush_price}\n")
+            file.write(f"apples,KILO,{self.apples_price}\n")
+            file.write(f"toothpaste,EACH,{self.toothpaste_price}\n")
+        self.catalog_path = self.path("prices.bin")
+        build_mapped_catalog(self.csv_path, self.catalog_path)
+        self.catalog = MappedCatalog(self.catalog_path)
+
+    def tearDown(self) -> None:
+        self.catalog.close()
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_unit_price(self):
+        self.assertEqual(len(self.catalog), 3)
+        self.assertEqual(self.catalog.unit_price(self.toothbrush), 0.99)
+        self.assertEqual(self.catalog.unit_price(self.apples), 1.99)
+        self.assertEqual(
+            self.catalog.unit_prices_cents([self.toothpaste, self.apples]),
+            {self.toothpaste: 179, self.apples: 199},
+        )
+
+    def test_unknown_product(self):
+        for product in [
+            Product("rice", ProductUnit.EACH),
+            Product("apple", ProductUnit.KILO),
+            Product("apples", ProductUnit.EACH),
+            Product("toothbrushes and more", ProductUnit.EACH),
+        ]:
+            with self.assertRaises(KeyError):
+                self.catalog.unit_price(product)
+
+    def test_is_read_only(self):
+        with self.assertRaises(Exception):
+            self.catalog.add_product(self.toothbrush, 1.09)
+
+    def test_checkout_matches_in_memory_catalog(self):
+        fake_catalog = FakeCatalog()
+        fake_catalog.add_product(self.toothbrush, self.toothbrush_price)
+        fake_catalog.add_product(self.apples, self.apples_price)
+        fake_catalog.add_product(self.toothpaste, self.toothpaste_price)
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.toothbrush, 3)
+        cart.add_item_quantity(self.apples, 1.25)
+        cart.add_item(self.toothpaste)
+
+        receipts = []
+        for catalog in (self.catalog, fake_catalog):
+            teller = Teller(catalog)
+            teller.add_special_offer(
+                SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+            )
+            receipts.append(
+                ReceiptPrinter().print_receipt(teller.checks_out_articles_from(cart))
+            )
+
+        self.assertEqual(receipts[0], receipts[1])
+
+    def test_many_products(self):
+        path = self.path("many.bin")
+        rows = [(f"product-{index}", "EACH", index / 100) for index in range(1000)]
+        write_mapped_catalog(path, reversed(rows))
+
+        with MappedCatalog(path) as catalog:
+            for name, _, price in rows:
+                self.assertEqual(
+                    catalog.unit_price(Product(name, ProductUnit.EACH)), price
+                )
+
+    def test_duplicate_products(self):
+        with self.assertRaises(ValueError):
+            write_mapped_catalog(
+                self.path("duplicate.bin"),
+                [("rice", "EACH", 2.49), ("rice", "KILO", 1.99)],
+            )
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            MappedCatalog(self.csv_path)
+
+    def test_main(self):
+        path = self.path("main.bin")
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(mapped_catalog.main([self.csv_path, path]), 0)
+
+        self.assertIn("products=3", stderr.getvalue())
+        with MappedCatalog(path) as catalog:
+            self.assertEqual(catalog.unit_price(self.apples), 1.99)
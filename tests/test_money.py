@@ -0,0 +1,30 @@
+import unittest
+from decimal import Decimal
+
+import ddt
+
+from models.money import format_cents, from_cents, round_half_up, to_cents
+
+
+@ddt.ddt
+class MoneyTestCase(unittest.TestCase):
+    @ddt.data((0.99, 99), (1.79, 179), (7, 700), ("2.675", 268), (1.005, 101))
+    @ddt.unpack
+    def test_to_cents(self, amount, cents):
+        self.assertEqual(to_cents(amount), cents)
+
+    def test_to_cents_decimal(self):
+        self.assertEqual(to_cents(Decimal("-0.125")), -13)
+
+    @ddt.data((298.5, 299), (298.49, 298), (-0.5, -1), (2.4999999999999996, 3), (0, 0))
+    @ddt.unpack
+    def test_round_half_up(self, value, cents):
+        self.assertEqual(round_half_up(value), cents)
+
+    @ddt.data((845, "8.45"), (-5, "-0.05"), (0, "0.00"), (123456, "1234.56"))
+    @ddt.unpack
+    def test_format_cents(self, cents, printed):
+        self.assertEqual(format_cents(cents), printed)
+
+    def test_from_cents(self):
+        self.assertEqual(from_cents(99), 0.99)
@@ -0,0 +1,102 @@
+import threading
+import unittest
+
+from models.offers import Offer, SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class OfferTableTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.catalog.add_product(product=self.rice, price=self.rice_price)
+        self.teller = Teller(self.catalog)
+
+    def test_updates_publish_new_versions(self):
+        self.assertEqual(self.teller.offer_table.version, 0)
+
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.rice, 1)],
+            10,
+        )
+
+        self.assertEqual(self.teller.offer_table.version, 2)
+        self.assertIn(self.toothbrush, self.teller.offers)
+        self.assertEqual(len(self.teller.bundles[self.rice]), 1)
+
+    def test_snapshot_is_not_mutated_by_updates(self):
+        snapshot = self.teller.offer_table
+
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.rice, 1)],
+            10,
+        )
+
+        self.assertEqual(snapshot.version, 0)
+        self.assertEqual(snapshot.offers, {})
+        self.assertEqual(snapshot.compiled_offers, {})
+        self.assertEqual(snapshot.bundles, {})
+
+    def test_offer_views_are_read_only(self):
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        offer = Offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.rice, 10)
+
+        with self.assertRaises(TypeError):
+            self.teller.offers[self.rice] = offer
+        with self.assertRaises(TypeError):
+            self.teller.compiled_offers[self.rice] = offer.compile()
+        with self.assertRaises(TypeError):
+            self.teller.bundles[self.rice] = ()
+        self.assertEqual(list(self.teller.offers), [self.toothbrush])
+
+    def test_concurrent_updates_and_checkouts(self):
+        products = [Product(f"item-{index}", ProductUnit.EACH) for index in range(50)]
+        for product in products:
+            self.catalog.add_product(product, 1.0)
+        cart = ShoppingCart()
+        for product in products:
+            cart.add_item_quantity(product, 3)
+        totals = []
+
+        def update(offset: int) -> None:
+            for product in products[offset::2]:
+                self.teller.add_special_offer(
+                    SpecialOfferType.THREE_FOR_TWO, product, None
+                )
+
+        def checkout() -> None:
+            for _ in range(20):
+                totals.append(self.teller.checks_out_articles_from(cart).total_cents())
+
+        threads = [threading.Thread(target=update, args=(offset,)) for offset in (0, 1)]
+        threads += [threading.Thread(target=checkout) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.teller.offer_table.version, len(products))
+        self.assertEqual(len(self.teller.offers), len(products))
+        self.assertTrue(all(10000 <= total <= 15000 for total in totals))
+        self.assertEqual(
+            self.teller.checks_out_articles_from(cart).total_cents(), 10000
+        )
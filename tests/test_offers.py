@@ -0,0 +1,73 @@
+import typing
+import unittest
+from enum import Enum
+
+from models.money import Cents
+from models.offers import (
+    OFFER_RULES,
+    Discount,
+    Offer,
+    SpecialOfferType,
+    register_offer_rule,
+)
+from models.products import Product, ProductUnit
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class PluginOfferType(Enum):
+    BUY_ONE_GET_ONE = 1
+
+
+def buy_one_get_one(
+    offer: Offer, quantity: float, prices: typing.Dict[Product, Cents]
+) -> Discount:
+    return Discount.from_cents(
+        offer.product, offer.description, -(quantity // 2) * prices[offer.product]
+    )
+
+
+class OfferRuleTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.teller = Teller(self.catalog)
+        self.shopping_cart = ShoppingCart()
+
+    def tearDown(self) -> None:
+        OFFER_RULES.pop(PluginOfferType.BUY_ONE_GET_ONE, None)
+
+    def test_compiled_offer_respects_minimum_quantity(self):
+        compiled = Offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        ).compile()
+        prices = {self.toothbrush: 99}
+
+        self.assertIsNone(compiled(2, prices))
+        self.assertEqual(compiled(3, prices).discount_cents, -99)
+        self.assertEqual(compiled(3, prices).description, "3 for 2")
+
+    def test_registered_plugin_offer_is_applied(self):
+        register_offer_rule(
+            PluginOfferType.BUY_ONE_GET_ONE, lambda offer: "buy 1 get 1", 2
+        )(buy_one_get_one)
+        self.teller.add_special_offer(
+            PluginOfferType.BUY_ONE_GET_ONE, self.toothbrush, None
+        )
+
+        self.shopping_cart.add_item_quantity(self.toothbrush, 5)
+        receipt = self.teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(len(receipt.discounts), 1)
+        self.assertEqual(receipt.discounts[0].description, "buy 1 get 1")
+        self.assertEqual(receipt.discounts[0].discount_amount, -1.98)
+
+    def test_unregistered_offer_type_is_rejected(self):
+        with self.assertRaises(KeyError):
+            self.teller.add_special_offer(
+                PluginOfferType.BUY_ONE_GET_ONE, self.toothbrush, None
+            )
@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from models.offers import SpecialOfferType
+from models.products import Product, ProductUnit
+from price_history_catalog import PriceHistoryCatalog
+from shopping_cart import ShoppingCart
+from teller import Teller
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class PriceHistoryCatalogTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    apples = Product("apples", ProductUnit.KILO)
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.catalog = PriceHistoryCatalog(clock=self.clock)
+        self.catalog.add_product(self.toothbrush, 0.99, at=100)
+        self.catalog.add_product(self.toothbrush, 1.09, at=200)
+        self.catalog.add_product(self.toothbrush, 0.89, at=300)
+        self.catalog.add_product(self.apples, 1.99, at=150)
+
+    def test_current_price(self):
+        self.assertEqual(self.catalog.unit_price(self.toothbrush), 0.89)
+        self.assertEqual(self.catalog.unit_price(self.apples), 1.99)
+
+    def test_point_in_time_price(self):
+        self.assertEqual(self.catalog.unit_price(self.toothbrush, at=100), 0.99)
+        self.assertEqual(self.catalog.unit_price(self.toothbrush, at=199.9), 0.99)
+        self.assertEqual(self.catalog.unit_price(self.toothbrush, at=200), 1.09)
+        self.assertEqual(self.catalog.unit_price(self.toothbrush, at=1e9), 0.89)
+        self.assertEqual(
+            self.catalog.unit_prices_cents([self.toothbrush, self.apples], at=250),
+            {self.toothbrush: 109, self.apples: 199},
+        )
+
+    def test_no_price_before_first_change(self):
+        with self.assertRaises(KeyError):
+            self.catalog.unit_price(self.apples, at=120)
+        with self.assertRaises(KeyError):
+            self.catalog.unit_price(Product("rice", ProductUnit.EACH))
+
+    def test_changes_use_clock_and_keep_time_order(self):
+        self.clock.now = 400
+        self.catalog.add_product(self.apples, 2.49)
+
+        self.assertEqual(self.catalog.unit_price(self.apples, at=399), 1.99)
+        self.assertEqual(self.catalog.unit_price(self.apples, at=400), 2.49)
+        with self.assertRaises(ValueError):
+            self.catalog.add_product(self.apples, 1.49, at=399)
+
+    def test_long_histories_match_full_dumps(self):
+        generator = random.Random(11)
+        catalog = PriceHistoryCatalog()
+        dumps = []
+        for hour in range(200):
+            catalog.add_product(self.toothbrush, generator.randint(50, 500) / 100, hour)
+            dumps.append(catalog.unit_price(self.toothbrush))
+
+        self.assertEqual(catalog.changes(self.toothbrush), 200)
+        for hour, price in enumerate(dumps):
+            self.assertEqual(catalog.unit_price(self.toothbrush, at=hour + 0.5), price)
+
+    def test_snapshot(self):
+        snapshot = self.catalog.snapshot(120)
+
+        self.assertEqual(snapshot.unit_price(self.toothbrush), 0.99)
+        self.assertEqual(
+            snapshot.unit_prices_cents([self.toothbrush]), {self.toothbrush: 99}
+        )
+        with self.assertRaises(KeyError):
+            snapshot.unit_price(self.apples)
+
+    def test_replay_checkout_as_of(self):
+        teller = Teller(self.catalog.as_of(250))
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.toothbrush, 3)
+
+        self.assertEqual(teller.checks_out_articles_from(cart).total_cents(), 218)
+        with self.assertRaises(Exception):
+            self.catalog.as_of(250).add_product(self.toothbrush, 1.0)
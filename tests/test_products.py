@@ -0,0 +1,40 @@
+import copy
+import pickle
+import unittest
+
+from models.products import Product, ProductQuantity, ProductUnit
+
+
+class ProductTestCase(unittest.TestCase):
+    def test_products_with_same_name_and_unit_are_equal(self):
+        first = Product("apples", ProductUnit.KILO)
+        second = Product("apples", ProductUnit.KILO)
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual({first: 1.99}[second], 1.99)
+
+    def test_products_with_different_unit_are_not_equal(self):
+        self.assertNotEqual(
+            Product("apples", ProductUnit.KILO), Product("apples", ProductUnit.EACH)
+        )
+
+    def test_products_are_immutable(self):
+        product = Product("apples", ProductUnit.KILO)
+        prices = {product: 1.99}
+
+        with self.assertRaises(AttributeError):
+            product.name = "pears"
+        with self.assertRaises(AttributeError):
+            product.unit = ProductUnit.EACH
+        with self.assertRaises(AttributeError):
+            del product.name
+        self.assertEqual(prices[Product("apples", ProductUnit.KILO)], 1.99)
+        self.assertEqual(copy.copy(product), product)
+        self.assertEqual(pickle.loads(pickle.dumps(product)), product)
+
+    def test_value_types_have_no_instance_dict(self):
+        product = Product("rice", ProductUnit.EACH)
+
+        self.assertFalse(hasattr(product, "__dict__"))
+        self.assertFalse(hasattr(ProductQuantity(product, 1), "__dict__"))
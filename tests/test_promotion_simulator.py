@@ -0,0 +1,138 @@
+import random
+import unittest
+
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from promotion_simulator import PromotionSimulator
+from receipt import ReceiptLineMode
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class PromotionSimulatorTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    cherry_tomatoes = Product("cherry_tomatoes", ProductUnit.EACH)
+    cherry_tomatoes_price = 0.69
+
+    def setUp(self) -> None:
+        self.catalog = FakeCatalog()
+        self.catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        self.catalog.add_product(product=self.apples, price=self.apples_price)
+        self.catalog.add_product(product=self.rice, price=self.rice_price)
+        self.catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.catalog.add_product(
+            product=self.cherry_tomatoes, price=self.cherry_tomatoes_price
+        )
+        self.carts = self.random_carts(300)
+        self.scenarios = {
+            "none": lambda teller: None,
+            "offers": self.offers,
+            "bundles": self.bundles,
+            "offers and bundles": lambda teller: (
+                self.offers(teller),
+                self.bundles(teller),
+            ),
+        }
+
+    def offers(self, teller: Teller) -> None:
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+        teller.add_special_offer(SpecialOfferType.TEN_PERCENT_DISCOUNT, self.apples, 20)
+        teller.add_special_offer(
+            SpecialOfferType.FIVE_FOR_AMOUNT, self.toothpaste, 7.49
+        )
+        teller.add_special_offer(
+            SpecialOfferType.TWO_FOR_AMOUNT, self.cherry_tomatoes, 0.99
+        )
+
+    def bundles(self, teller: Teller) -> None:
+        teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 2)],
+            10,
+        )
+        teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.rice, 1)],
+            20,
+        )
+
+    def random_carts(self, count: int) -> list[ShoppingCart]:
+        generator = random.Random(5)
+        products = [
+            self.toothbrush,
+            self.apples,
+            self.rice,
+            self.toothpaste,
+            self.cherry_tomatoes,
+        ]
+        carts = []
+        for _ in range(count):
+            cart = ShoppingCart()
+            for _ in range(generator.randint(0, 12)):
+                product = generator.choice(products)
+                if product.unit == ProductUnit.KILO:
+                    cart.add_item_quantity(product, generator.uniform(0.1, 3.0))
+                else:
+                    cart.add_item_quantity(product, generator.randint(1, 6))
+            carts.append(cart)
+        return carts
+
+    def checkout_totals(
+        self, configure, line_mode: ReceiptLineMode = ReceiptLineMode.ITEMIZED
+    ) -> tuple[int, int]:
+        teller = Teller(self.catalog, line_mode)
+        configure(teller)
+        gross = discount = 0
+        for cart in self.carts:
+            receipt = teller.checks_out_articles_from(cart)
+            gross += sum(item.total_cents for item in receipt.items)
+            discount += sum(discount.discount_cents for discount in receipt.discounts)
+        return gross, discount
+
+    def test_matches_full_checkout_for_every_scenario(self):
+        simulator = PromotionSimulator(self.catalog, self.carts)
+
+        results = simulator.simulate_many(self.scenarios)
+
+        self.assertEqual([result.name for result in results], list(self.scenarios))
+        for result in results:
+            gross, discount = self.checkout_totals(self.scenarios[result.name])
+            self.assertEqual(result.baskets, len(self.carts))
+            self.assertEqual(result.gross_cents, gross)
+            self.assertEqual(result.discount_cents, discount, result.name)
+            self.assertEqual(result.total_cents, gross + discount)
+
+    def test_aggregated_line_mode(self):
+        simulator = PromotionSimulator(
+            self.catalog, self.carts, ReceiptLineMode.AGGREGATED
+        )
+
+        result = simulator.simulate(self.offers)
+
+        gross, discount = self.checkout_totals(self.offers, ReceiptLineMode.AGGREGATED)
+        self.assertEqual((result.gross_cents, result.discount_cents), (gross, discount))
+
+    def test_prices_are_fetched_once(self):
+        simulator = PromotionSimulator(self.catalog, self.carts)
+
+        simulator.simulate_many(self.scenarios)
+
+        self.assertEqual(self.catalog.lookups, 1)
+
+    def test_empty_corpus(self):
+        result = PromotionSimulator(self.catalog, []).simulate(self.offers, "empty")
+
+        self.assertEqual(result.total_cents, 0)
+        self.assertEqual(result.average_basket, 0.0)
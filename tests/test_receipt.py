@@ -89,3 +89,31 @@ class ReceiptTestCase(unittest.TestCase):
             self.receipt.total_price(),
             apples_quantity * self.apples_price + discount.discount_amount,
         )
+
+    def test_views_are_cached_until_mutation(self):
+        self.receipt.add_product(
+            product=self.rice, quantity=1, price=self.rice_price, total_price=2.49
+        )
+        items = self.receipt.items
+
+        self.assertIs(self.receipt.items, items)
+        self.assertIsInstance(items, tuple)
+
+        self.receipt.add_product(
+            product=self.apples, quantity=1, price=self.apples_price, total_price=1.99
+        )
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(len(self.receipt.items), 2)
+
+    def test_iter_items_and_discounts(self):
+        self.receipt.add_product(
+            product=self.rice, quantity=1, price=self.rice_price, total_price=2.49
+        )
+        discount = Discount(product=self.rice, description="Test", discount_amount=-1)
+        self.receipt.add_discount(discount)
+
+        self.assertEqual(
+            [item.product for item in self.receipt.iter_items()], [self.rice]
+        )
+        self.assertEqual(list(self.receipt.iter_discounts()), [discount])
@@ -0,0 +1,108 @@
+import io
+import pickle
+import random
+import unittest
+
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt import Receipt
+from receipt_archive import ReceiptArchiveWriter, read_receipts
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class ReceiptArchiveTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    def setUp(self) -> None:
+        catalog = FakeCatalog()
+        catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        catalog.add_product(product=self.apples, price=self.apples_price)
+        catalog.add_product(product=self.rice, price=self.rice_price)
+        catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.teller = Teller(catalog)
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_special_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT, self.apples, 20
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 2)],
+            10,
+        )
+
+    def random_receipts(self, count: int) -> list[Receipt]:
+        generator = random.Random(3)
+        products = [self.toothbrush, self.apples, self.rice, self.toothpaste]
+        receipts = []
+        for _ in range(count):
+            cart = ShoppingCart()
+            for _ in range(generator.randint(0, 10)):
+                product = generator.choice(products)
+                if product.unit == ProductUnit.KILO:
+                    cart.add_item_quantity(product, generator.uniform(0.1, 3.0))
+                elif generator.random() < 0.5:
+                    cart.add_item(product)
+                else:
+                    cart.add_item_quantity(product, generator.randint(1, 6))
+            receipts.append(self.teller.checks_out_articles_from(cart))
+        return receipts
+
+    def archive(self, receipts: list[Receipt], batch_size: int = 1024) -> bytes:
+        stream = io.BytesIO()
+        with ReceiptArchiveWriter(stream, batch_size) as writer:
+            writer.write_all(receipts)
+        return stream.getvalue()
+
+    def test_round_trip_prints_identically(self):
+        receipts = self.random_receipts(300)
+
+        decoded = list(read_receipts(io.BytesIO(self.archive(receipts, 64))))
+
+        printer = ReceiptPrinter()
+        self.assertEqual(len(decoded), len(receipts))
+        for original, restored in zip(receipts, decoded):
+            self.assertEqual(
+                printer.print_receipt(restored), printer.print_receipt(original)
+            )
+
+    def test_products_are_written_once_per_batch(self):
+        receipts = self.random_receipts(100)
+
+        single_batch = self.archive(receipts)
+        receipt_batches = self.archive(receipts, batch_size=1)
+
+        self.assertEqual(single_batch.count(b"toothpaste"), 1)
+        self.assertGreater(receipt_batches.count(b"toothpaste"), 1)
+
+    def test_smaller_than_pickle(self):
+        receipts = self.random_receipts(100)
+
+        self.assertLess(len(self.archive(receipts)), len(pickle.dumps(receipts)))
+
+    def test_empty_archive(self):
+        self.assertEqual(list(read_receipts(io.BytesIO(self.archive([])))), [])
+
+    def test_rejects_other_streams(self):
+        with self.assertRaises(ValueError):
+            list(read_receipts(io.BytesIO(b"not an archive")))
+
+    def test_truncated_archive(self):
+        data = self.archive(self.random_receipts(5))
+
+        with self.assertRaises(ValueError):
+            list(read_receipts(io.BytesIO(data[:-3])))
@@ -0,0 +1,133 @@
+import io
+import random
+import unittest
+
+from models.offers import Discount
+from models.products import Product, ProductUnit
+from receipt import Receipt
+from receipt_printer import ReceiptPrinter
+
+
+class ReceiptPrinterTestCase(unittest.TestCase):
+    receipt: Receipt | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    def setUp(self) -> None:
+        self.receipt = Receipt()
+        self.receipt.add_product(
+            product=self.toothbrush,
+            quantity=3,
+            price=self.toothbrush_price,
+            total_price=3 * self.toothbrush_price,
+        )
+        self.receipt.add_product(
+            product=self.apples,
+            quantity=1,
+            price=self.apples_price,
+            total_price=self.apples_price,
+        )
+        self.receipt.add_discount(
+            Discount(
+                product=self.toothbrush, description="3 for 2", discount_amount=-0.99
+            )
+        )
+
+    def test_print_receipt(self):
+        self.assertEqual(
+            ReceiptPrinter().print_receipt(self.receipt),
+            "toothbrush                          2.97\n"
+            "  0.99 * 3\n"
+            "apples                              1.99\n"
+            "3 for 2 (toothbrush)               -0.99\n"
+            "\n"
+            "Total:                              3.97\n",
+        )
+
+    def test_write_receipt_matches_print_receipt(self):
+        printer = ReceiptPrinter(columns=20)
+        stream = io.StringIO()
+
+        printer.write_receipt(self.receipt, stream)
+
+        self.assertEqual(stream.getvalue(), printer.print_receipt(self.receipt))
+
+    def test_write_receipt_streams_line_by_line(self):
+        printer = ReceiptPrinter(columns=20)
+        writes = []
+
+        class Sink:
+            def write(self, text: str) -> int:
+                writes.append(text)
+                return len(text)
+
+        printer.write_receipt(self.receipt, Sink())
+
+        self.assertGreater(len(writes), 1)
+        self.assertTrue(all(text.count("\n") <= 1 for text in writes))
+        self.assertEqual("".join(writes), printer.print_receipt(self.receipt))
+
+    def test_long_name_is_not_padded(self):
+        printer = ReceiptPrinter(columns=10)
+
+        self.assertEqual(
+            printer.format_line_with_whitespace("cherry_tomatoes", "0.69"),
+            "cherry_tomatoes0.69\n",
+        )
+
+    def test_print_receipts_matches_print_receipt(self):
+        generator = random.Random(2)
+        products = [self.toothbrush, self.apples]
+        receipts = [self.receipt]
+        for _ in range(200):
+            receipt = Receipt()
+            for _ in range(generator.randint(0, 6)):
+                product = generator.choice(products)
+                quantity = (
+                    round(generator.uniform(0.1, 3.0), 3)
+                    if product.unit == ProductUnit.KILO
+                    else generator.randint(1, 4)
+                )
+                price = generator.choice((0.99, 1.99, 12.5))
+                receipt.add_product(product, quantity, price, quantity * price)
+            if receipt.items and generator.random() < 0.5:
+                receipt.add_discount(
+                    Discount(receipt.items[0].product, "10% off", -0.25)
+                )
+            receipts.append(receipt)
+        printer = ReceiptPrinter(columns=24, cache_size=8)
+
+        printed = list(printer.print_receipts(receipts))
+
+        self.assertEqual(printed, [printer.print_receipt(r) for r in receipts])
+        self.assertLessEqual(len(printer._columns), 8)
+        self.assertLessEqual(len(printer._amounts), 8)
+
+    def test_int_and_float_quantities_print_differently(self):
+        receipts = []
+        for quantity in (2.0, 2):
+            receipt = Receipt()
+            receipt.add_product(self.toothbrush, quantity, 0.99, 1.98)
+            receipts.append(receipt)
+        printer = ReceiptPrinter()
+
+        printed = list(printer.print_receipts(receipts))
+
+        self.assertIn("  0.99 * 2.0\n", printed[0])
+        self.assertIn("  0.99 * 2\n", printed[1])
+
+    def test_print_receipts_reports_throughput(self):
+        printer = ReceiptPrinter()
+
+        printed = printer.print_receipts([self.receipt, self.receipt])
+
+        self.assertEqual(printer.stats.receipts, 0)
+        self.assertEqual(len(list(printed)), 2)
+        self.assertEqual(printer.stats.receipts, 2)
+        self.assertEqual(printer.stats.lines, 6)
+        self.assertGreater(printer.stats.seconds, 0)
+        self.assertGreater(printer.stats.receipts_per_second, 0)
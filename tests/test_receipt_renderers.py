@@ -0,0 +1,191 @@
+import json
+import random
+import unittest
+
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt import Receipt
+from receipt_printer import ReceiptPrinter
+from receipt_renderers import (
+    EscPosRenderer,
+    JsonRenderer,
+    ReceiptRenderer,
+    TextRenderer,
+    register_renderer,
+    renderer_for,
+)
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class ReceiptRenderersTestCase(unittest.TestCase):
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    def setUp(self) -> None:
+        catalog = FakeCatalog()
+        catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        catalog.add_product(product=self.apples, price=self.apples_price)
+        catalog.add_product(product=self.rice, price=self.rice_price)
+        catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        self.teller = Teller(catalog)
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_special_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT, self.apples, 20
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 2)],
+            10,
+        )
+
+    def random_receipts(self, count: int) -> list[Receipt]:
+        generator = random.Random(5)
+        products = [self.toothbrush, self.apples, self.rice, self.toothpaste]
+        receipts = []
+        for _ in range(count):
+            cart = ShoppingCart()
+            for _ in range(generator.randint(0, 10)):
+                product = generator.choice(products)
+                if product.unit == ProductUnit.KILO:
+                    cart.add_item_quantity(product, generator.uniform(0.1, 3.0))
+                else:
+                    cart.add_item_quantity(product, generator.randint(1, 6))
+            receipts.append(self.teller.checks_out_articles_from(cart))
+        return receipts
+
+    def test_text_matches_receipt_printer(self):
+        for columns in (40, 12):
+            renderer = TextRenderer(columns)
+            printer = ReceiptPrinter(columns)
+            for receipt in self.random_receipts(100):
+                self.assertEqual(
+                    renderer.render(receipt), printer.print_receipt(receipt).encode()
+                )
+
+    def test_int_and_float_quantities_render_like_printer(self):
+        renderer = TextRenderer()
+        for quantity in (2.0, 2):
+            receipt = Receipt()
+            receipt.add_product(self.toothbrush, quantity, 0.99, 1.98)
+            self.assertEqual(
+                renderer.render(receipt),
+                ReceiptPrinter().print_receipt(receipt).encode(),
+            )
+
+    def test_render_into_appends_to_buffer(self):
+        renderer = TextRenderer()
+        receipts = self.random_receipts(10)
+        buffer = bytearray()
+
+        for receipt in receipts:
+            renderer.render_into(receipt, buffer)
+
+        self.assertEqual(
+            bytes(buffer), b"".join(renderer.render(receipt) for receipt in receipts)
+        )
+
+    def test_json_describes_receipt(self):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.toothbrush, 3)
+        cart.add_item_quantity(self.apples, 0.5)
+        receipt = self.teller.checks_out_articles_from(cart)
+
+        document = json.loads(JsonRenderer().render(receipt))
+
+        self.assertEqual(
+            document,
+            {
+                "items": [
+                    {
+                        "product": "toothbrush",
+                        "unit": "EACH",
+                        "quantity": 3,
+                        "price": "0.99",
+                        "total": "2.97",
+                    },
+                    {
+                        "product": "apples",
+                        "unit": "KILO",
+                        "quantity": 0.5,
+                        "price": "1.99",
+                        "total": "1.00",
+                    },
+                ],
+                "discounts": [
+                    {
+                        "product": "toothbrush",
+                        "description": "3 for 2",
+                        "amount": "-0.99",
+                    },
+                    {
+                        "product": "apples",
+                        "description": "20% off",
+                        "amount": "-0.20",
+                    },
+                ],
+                "total": "2.78",
+            },
+        )
+
+    def test_json_renders_every_receipt(self):
+        renderer = JsonRenderer()
+        for receipt in self.random_receipts(100):
+            document = json.loads(renderer.render(receipt))
+            self.assertEqual(len(document["items"]), len(receipt.items))
+            self.assertEqual(len(document["discounts"]), len(receipt.discounts))
+            self.assertEqual(float(document["total"]), receipt.total_price())
+
+    def test_json_caches_are_bounded(self):
+        renderer = JsonRenderer(cache_size=4)
+        for receipt in self.random_receipts(50):
+            json.loads(renderer.render(receipt))
+
+        self.assertLessEqual(len(renderer._amounts), 4)
+        self.assertLessEqual(len(renderer._products), 4)
+
+    def test_escpos_frames_text_receipt(self):
+        receipt = self.random_receipts(1)[0]
+
+        printed = EscPosRenderer(columns=40).render(receipt)
+        text = TextRenderer(columns=40, encoding="cp437").render(receipt)
+        start = text.rindex(b"Total: ")
+        total = text[start:]
+
+        self.assertTrue(printed.startswith(EscPosRenderer.INITIALIZE))
+        self.assertTrue(printed.endswith(EscPosRenderer.FEED_AND_CUT))
+        self.assertIn(EscPosRenderer.BOLD_ON + total + EscPosRenderer.BOLD_OFF, printed)
+
+    def test_escpos_replaces_unencodable_names(self):
+        receipt = Receipt()
+        receipt.add_product(Product("café ☕", ProductUnit.EACH), 1, 2.5, 2.5)
+
+        printed = EscPosRenderer().render(receipt)
+
+        self.assertIn("café ?".encode("cp437"), printed)
+
+    def test_renderer_must_implement_render_into(self):
+        with self.assertRaises(TypeError):
+            ReceiptRenderer()
+
+    def test_renderer_registry(self):
+        self.assertIsInstance(renderer_for("text", columns=20), TextRenderer)
+        self.assertIsInstance(renderer_for("escpos"), EscPosRenderer)
+        self.assertIsInstance(renderer_for("json"), JsonRenderer)
+
+        register_renderer("wide", lambda: TextRenderer(columns=80))
+        self.assertEqual(renderer_for("wide").columns, 80)
+        with self.assertRaises(KeyError):
+            renderer_for("pdf")
@@ -0,0 +1,148 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+import replay
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class ReplayTestCase(unittest.TestCase):
+    directory: tempfile.TemporaryDirectory | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    baskets = [
+        ("b1", [("toothbrush", 3), ("apples", 1.5)]),
+        ("b2", [("toothbrush", 1), ("toothpaste", 1)]),
+        ("b3", [("apples", 0.25)]),
+    ]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.catalog_path = self.path("catalog.csv")
+        with open(self.catalog_path, "w") as file:
+            file.write("name,unit,price\n")
+            file.write(f"toothbrush,EACH,{self.toothbrush_price}\n")
+            file.write(f"apples,KILO,{self.apples_price}\n")
+            file.write(f"toothpaste,EACH,{self.toothpaste_price}\n")
+        self.offers_path = self.path("offers.json")
+        with open(self.offers_path, "w") as file:
+            json.dump(
+                {
+                    "offers": [{"type": "THREE_FOR_TWO", "product": "toothbrush"}],
+                    "bundles": [
+                        {
+                            "type": "TEN_PERCENT_DISCOUNT",
+                            "products": {"toothbrush": 1, "toothpaste": 1},
+                            "argument": 10,
+                        }
+                    ],
+                },
+                file,
+            )
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def expected_results(self) -> list[tuple[str, str, float]]:
+        catalog = FakeCatalog()
+        catalog.add_product(self.toothbrush, self.toothbrush_price)
+        catalog.add_product(self.apples, self.apples_price)
+        catalog.add_product(self.toothpaste, self.toothpaste_price)
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+        teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.toothpaste, 1)],
+            10,
+        )
+        products = {
+            "toothbrush": self.toothbrush,
+            "apples": self.apples,
+            "toothpaste": self.toothpaste,
+        }
+        results = []
+        for basket_id, items in self.baskets:
+            cart = ShoppingCart()
+            for name, quantity in items:
+                cart.add_item_quantity(products[name], quantity)
+            receipt = teller.checks_out_articles_from(cart)
+            results.append(
+                (
+                    basket_id,
+                    ReceiptPrinter().print_receipt(receipt),
+                    receipt.total_price(),
+                )
+            )
+        return results
+
+    def run_main(self, baskets_path: str, workers: str) -> list[dict]:
+        output_path = self.path("receipts.jsonl")
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            exit_code = replay.main(
+                [
+                    baskets_path,
+                    "--catalog",
+                    self.catalog_path,
+                    "--offers",
+                    self.offers_path,
+                    "--output",
+                    output_path,
+                    "--workers",
+                    workers,
+                    "--chunk-size",
+                    "2",
+                ]
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stderr.getvalue().count("baskets/s="), len(workers.split(",")))
+        with open(output_path) as file:
+            return [json.loads(line) for line in file]
+
+    def test_replay_jsonl_in_order(self):
+        baskets_path = self.path("baskets.jsonl")
+        with open(baskets_path, "w") as file:
+            for basket_id, items in self.baskets:
+                file.write(json.dumps({"id": basket_id, "items": items}) + "\n")
+
+        results = self.run_main(baskets_path, "1,2")
+
+        self.assertEqual(
+            [(r["id"], r["receipt"], r["total"]) for r in results],
+            self.expected_results(),
+        )
+
+    def test_replay_csv(self):
+        baskets_path = self.path("baskets.csv")
+        with open(baskets_path, "w") as file:
+            file.write("basket_id,product,quantity\n")
+            for basket_id, items in self.baskets:
+                for name, quantity in items:
+                    file.write(f"{basket_id},{name},{quantity}\n")
+
+        results = self.run_main(baskets_path, "2")
+
+        self.assertEqual([r["id"] for r in results], ["b1", "b2", "b3"])
+        self.assertEqual(
+            [r["total"] for r in results],
+            [total for _, _, total in self.expected_results()],
+        )
@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from models.offers import SpecialOfferType
+from models.products import Product, ProductQuantity, ProductUnit
+from receipt import ReceiptLineMode
+from receipt_printer import ReceiptPrinter
+from shopping_cart import ShoppingCart
+from teller import Teller
+from tests.fake_catalog import FakeCatalog
+
+
+class RunningReceiptTestCase(unittest.TestCase):
+    catalog: FakeCatalog | None = None
+    teller: Teller | None = None
+
+    toothbrush = Product("toothbrush", ProductUnit.EACH)
+    toothbrush_price = 0.99
+
+    apples = Product("apples", ProductUnit.KILO)
+    apples_price = 1.99
+
+    rice = Product("rice", ProductUnit.EACH)
+    rice_price = 2.49
+
+    toothpaste = Product("toothpaste", ProductUnit.EACH)
+    toothpaste_price = 1.79
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.catalog = FakeCatalog()
+
+        cls.catalog.add_product(product=cls.toothbrush, price=cls.toothbrush_price)
+        cls.catalog.add_product(product=cls.apples, price=cls.apples_price)
+        cls.catalog.add_product(product=cls.rice, price=cls.rice_price)
+        cls.catalog.add_product(product=cls.toothpaste, price=cls.toothpaste_price)
+
+    def setUp(self) -> None:
+        self.teller = Teller(self.catalog)
+        self.teller.add_special_offer(
+            SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None
+        )
+        self.teller.add_special_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT, self.apples, 20
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.rice, 1), ProductQuantity(self.toothpaste, 2)],
+            10,
+        )
+        self.teller.add_bundle_offer(
+            SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            [ProductQuantity(self.toothbrush, 1), ProductQuantity(self.rice, 1)],
+            20,
+        )
+
+    def test_running_total_matches_checkout_after_every_scan(self):
+        self.assert_running_total_matches_checkout()
+
+    def test_aggregated_running_total_matches_checkout(self):
+        self.teller.line_mode = ReceiptLineMode.AGGREGATED
+
+        self.assert_running_total_matches_checkout()
+
+    def assert_running_total_matches_checkout(self) -> None:
+        generator = random.Random(7)
+        products = [self.toothbrush, self.apples, self.rice, self.toothpaste]
+        running_receipt = self.teller.open_running_receipt()
+        cart = running_receipt.cart
+
+        for _ in range(200):
+            product = generator.choice(products)
+            scanned = cart.product_quantities.get(product, 0)
+            if scanned and generator.random() < 0.3:
+                cart.void_item_quantity(product, scanned if scanned < 1 else 1)
+            elif product.unit == ProductUnit.KILO:
+                cart.add_item_quantity(product, round(generator.uniform(0.1, 2), 3))
+            else:
+                cart.add_item(product)
+
+            expected = self.teller.checks_out_articles_from(cart)
+            self.assertEqual(running_receipt.total_cents(), expected.total_cents())
+
+        printer = ReceiptPrinter()
+        self.assertEqual(
+            printer.print_receipt(running_receipt.receipt()),
+            printer.print_receipt(self.teller.checks_out_articles_from(cart)),
+        )
+
+    def test_existing_cart_is_priced_on_open(self):
+        cart = ShoppingCart()
+        cart.add_item_quantity(self.toothbrush, 3)
+        cart.add_item(self.rice)
+
+        running_receipt = self.teller.open_running_receipt(cart)
+        cart.add_item_quantity(self.toothpaste, 2)
+
+        self.assertEqual(
+            running_receipt.total_price(),
+            self.teller.checks_out_articles_from(cart).total_price(),
+        )
+
+    def test_void_removes_offer_discount(self):
+        running_receipt = self.teller.open_running_receipt()
+        running_receipt.cart.add_item_quantity(self.toothbrush, 3)
+        self.assertEqual(running_receipt.total_cents(), 198)
+
+        running_receipt.cart.void_item_quantity(self.toothbrush, 1)
+
+        self.assertEqual(running_receipt.total_cents(), 198)
+        self.assertEqual(running_receipt.receipt().discounts, ())
@@ -42,3 +42,32 @@ class ShoppingCartTestCase(unittest.TestCase):
 
         self.assertEqual(len(self.shopping_cart.items), 2)
         self.assertEqual(self.shopping_cart.product_quantities[self.toothbrush], 5)
+
+    def test_void_item_quantity(self):
+        self.shopping_cart.add_item_quantity(self.toothbrush, 3)
+        self.shopping_cart.void_item_quantity(self.toothbrush, 1)
+
+        self.assertEqual(len(self.shopping_cart.items), 2)
+        self.assertEqual(self.shopping_cart.items[1].quantity, -1)
+        self.assertEqual(self.shopping_cart.product_quantities[self.toothbrush], 2)
+
+        self.shopping_cart.void_item_quantity(self.toothbrush, 2)
+
+        self.assertNotIn(self.toothbrush, self.shopping_cart.product_quantities)
+
+    def test_void_more_than_scanned(self):
+        self.shopping_cart.add_item(self.rice)
+
+        with self.assertRaises(ValueError):
+            self.shopping_cart.void_item_quantity(self.rice, 2)
+
+    def test_listener_is_notified(self):
+        scans = []
+        self.shopping_cart.add_listener(
+            lambda product, quantity: scans.append((product, quantity))
+        )
+
+        self.shopping_cart.add_item(self.rice)
+        self.shopping_cart.void_item_quantity(self.rice, 1)
+
+        self.assertEqual(scans, [(self.rice, 1.0), (self.rice, -1)])
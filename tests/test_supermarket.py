@@ -4,6 +4,7 @@ import ddt
 
 from models.offers import SpecialOfferType
 from models.products import Product, ProductQuantity, ProductUnit
+from receipt import ReceiptLineMode
 from shopping_cart import ShoppingCart
 from teller import Teller
 from tests.fake_catalog import FakeCatalog
@@ -251,13 +252,13 @@ class SupermarketTestCase(unittest.TestCase):
         self.assertEqual(discounts[0].description, f"{discount_percentage}% off")
         self.assertAlmostEqual(
             discounts[0].discount_amount,
-            -self.toothbrush_price * discount_percentage / 100 * min_mult * 2,
+            round(-self.toothbrush_price * discount_percentage / 100 * min_mult * 2, 2),
         )
         self.assertEqual(discounts[1].product, self.toothpaste)
         self.assertEqual(discounts[1].description, f"{discount_percentage}% off")
         self.assertAlmostEqual(
             discounts[1].discount_amount,
-            -self.toothpaste_price * discount_percentage / 100 * min_mult * 1,
+            round(-self.toothpaste_price * discount_percentage / 100 * min_mult * 1, 2),
         )
 
         receipt_items = receipt.items
@@ -303,3 +304,48 @@ class SupermarketTestCase(unittest.TestCase):
         self.assertEqual(receipt_items[1].price, self.toothpaste_price)
         self.assertAlmostEqual(receipt_items[1].total_price, 1 * self.toothpaste_price)
         self.assertEqual(receipt_items[1].quantity, 1)
+
+    def test_aggregated_lines(self):
+        catalog = FakeCatalog()
+        catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        catalog.add_product(product=self.apples, price=self.apples_price)
+        teller = Teller(catalog, line_mode=ReceiptLineMode.AGGREGATED)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+
+        for _ in range(50):
+            self.shopping_cart.add_item(self.toothbrush)
+        self.shopping_cart.add_item_quantity(self.apples, 0.5)
+        self.shopping_cart.add_item_quantity(self.apples, 0.25)
+        receipt = teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(catalog.lookups, 1)
+        self.assertEqual(
+            [(item.product, item.quantity, item.total_price) for item in receipt.items],
+            [(self.toothbrush, 50.0, 49.5), (self.apples, 0.75, 1.49)],
+        )
+        self.assertEqual(len(receipt.discounts), 1)
+        self.assertAlmostEqual(receipt.total_price(), 49.5 - 16 * 0.99 + 1.49)
+
+    def test_checkout_fetches_prices_in_one_lookup(self):
+        catalog = FakeCatalog()
+        catalog.add_product(product=self.toothbrush, price=self.toothbrush_price)
+        catalog.add_product(product=self.toothpaste, price=self.toothpaste_price)
+        teller = Teller(catalog)
+        teller.add_special_offer(SpecialOfferType.THREE_FOR_TWO, self.toothbrush, None)
+        teller.add_bundle_offer(
+            offer_type=SpecialOfferType.TEN_PERCENT_DISCOUNT,
+            product_quantities=[
+                ProductQuantity(product=self.toothbrush, quantity=1),
+                ProductQuantity(product=self.toothpaste, quantity=1),
+            ],
+            argument=10,
+        )
+
+        for _ in range(50):
+            self.shopping_cart.add_item(self.toothbrush)
+            self.shopping_cart.add_item(self.toothpaste)
+        receipt = teller.checks_out_articles_from(self.shopping_cart)
+
+        self.assertEqual(catalog.lookups, 1)
+        self.assertEqual(len(receipt.items), 100)
+        self.assertEqual(len(receipt.discounts), 3)